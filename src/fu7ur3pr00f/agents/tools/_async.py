@@ -1,21 +1,16 @@
 """Shared async helper for running coroutines from sync tool contexts."""
 
-import asyncio
-import concurrent.futures
+from ...mcp.pool import run_coroutine
 
 
 def run_async(coro):
     """Run an async coroutine from a sync context (ToolNode thread pool).
 
-    Handles the case where an event loop is already running by spawning
-    a new thread with its own loop.
-    """
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
+    Coroutines are submitted to the MCP pool's long-lived background event
+    loop, so callers pay neither a new loop per call nor a new thread when
+    invoked from inside an already running loop.
 
-    if loop and loop.is_running():
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            return pool.submit(asyncio.run, coro).result()
-    return asyncio.run(coro)
+    Raises:
+        RuntimeError: If called from the pool's loop thread itself
+    """
+    return run_coroutine(coro)
@@ -1,26 +1,27 @@
 """GitLab tools for live queries via glab CLI."""
 
-import re
 import shutil
+import string
 import subprocess  # nosec B404 — required for glab CLI interaction
 
 from langchain_core.tools import tool
 
-# Validation patterns for GitLab CLI inputs
-_RE_GIT_REF = re.compile(r"^[a-zA-Z0-9._/-]+$")
-_RE_PROJECT_PATH = re.compile(r"^[a-zA-Z0-9._/-]+$")
-_RE_FILE_PATH = re.compile(r"^[a-zA-Z0-9._/ -]+$")
+# Allowed character sets for GitLab CLI inputs (checked with a set
+# superset test instead of a regex — these are pure character classes)
+_GIT_REF_CHARS = frozenset(string.ascii_letters + string.digits + "._/-")
+_PROJECT_PATH_CHARS = _GIT_REF_CHARS
+_FILE_PATH_CHARS = _GIT_REF_CHARS | {" "}
 
 
 def _validate_gitlab_input(
-    value: str, name: str, pattern: re.Pattern[str], max_len: int,
+    value: str, name: str, allowed: frozenset[str], max_len: int,
 ) -> str | None:
     """Validate a GitLab CLI input. Returns error message or None if valid."""
     if not value or len(value) > max_len:
         return f"Invalid {name}: must be 1-{max_len} characters."
     if value.startswith("-"):
         return f"Invalid {name}: must not start with '-'."
-    if not pattern.match(value):
+    if not allowed.issuperset(value):
         return f"Invalid {name}: contains disallowed characters."
     return None
 
@@ -74,7 +75,7 @@ def get_gitlab_project(project_path: str) -> str:
     Use this to get detailed information about a specific GitLab project
     including description, README content, and recent activity.
     """
-    err = _validate_gitlab_input(project_path, "project path", _RE_PROJECT_PATH, 256)
+    err = _validate_gitlab_input(project_path, "project path", _PROJECT_PATH_CHARS, 256)
     if err:
         return err
     return _glab(["repo", "view", project_path, "--output", "json"])
@@ -92,13 +93,13 @@ def get_gitlab_file(project_path: str, file_path: str, ref: str = "main") -> str
     Use this to read specific files from a GitLab repo like README.md,
     package.json, etc.
     """
-    err = _validate_gitlab_input(project_path, "project path", _RE_PROJECT_PATH, 256)
+    err = _validate_gitlab_input(project_path, "project path", _PROJECT_PATH_CHARS, 256)
     if err:
         return err
-    err = _validate_gitlab_input(file_path, "file path", _RE_FILE_PATH, 512)
+    err = _validate_gitlab_input(file_path, "file path", _FILE_PATH_CHARS, 512)
     if err:
         return err
-    err = _validate_gitlab_input(ref, "ref", _RE_GIT_REF, 256)
+    err = _validate_gitlab_input(ref, "ref", _GIT_REF_CHARS, 256)
     if err:
         return err
 
@@ -1,5 +1,6 @@
 """Market intelligence tools for the career agent."""
 
+import asyncio
 from typing import TYPE_CHECKING
 from unicodedata import normalize
 
@@ -426,12 +427,10 @@ def gather_market_data(source: str = "all") -> str:
     or wants to refresh market data.
     """
     result_parts = [f"Market intelligence gathering (source={source}):"]
+    results = run_async(_refresh_market_sources(source))
 
-    if source in ("all", "trends"):
-        from fu7ur3pr00f.gatherers.market import TechTrendsGatherer
-
-        gatherer = TechTrendsGatherer()
-        data = run_async(gatherer.gather_with_cache(refresh=True))
+    if "trends" in results:
+        data = results["trends"]
         stories = data.get("trending_stories", [])
         hiring = data.get("hiring_trends", {})
         hn_jobs = data.get("hn_job_postings", [])
@@ -442,11 +441,8 @@ def gather_market_data(source: str = "all") -> str:
         if hn_jobs:
             result_parts.append(f"  HN job postings: {len(hn_jobs)} extracted")
 
-    if source in ("all", "jobs"):
-        from fu7ur3pr00f.gatherers.market import JobMarketGatherer
-
-        gatherer = JobMarketGatherer()
-        data = run_async(gatherer.gather_with_cache(refresh=True, role="Software Developer"))
+    if "jobs" in results:
+        data = results["jobs"]
         listings = data.get("job_listings", [])
         sources_list = data.get("summary", {}).get("sources", [])
         remote = data.get("summary", {}).get("remote_positions", 0)
@@ -455,11 +451,8 @@ def gather_market_data(source: str = "all") -> str:
         )
         result_parts.append(f"  Remote positions: {remote}")
 
-    if source in ("all", "content"):
-        from fu7ur3pr00f.gatherers.market import ContentTrendsGatherer
-
-        gatherer = ContentTrendsGatherer()
-        data = run_async(gatherer.gather_with_cache(refresh=True, focus="all"))
+    if "content" in results:
+        data = results["content"]
         articles = data.get("devto_articles", [])
         so_trends = data.get("stackoverflow_trends", {})
         topic_pop = so_trends.get("topic_popularity", [])
@@ -468,3 +461,31 @@ def gather_market_data(source: str = "all") -> str:
             result_parts.append(f"  Stack Overflow: {len(topic_pop)} tags tracked")
 
     return "\n".join(result_parts)
+
+
+async def _refresh_market_sources(source: str) -> dict[str, dict]:
+    """Refresh the requested market gatherers concurrently on one event loop.
+
+    Returns:
+        Gathered data keyed by "trends", "jobs" and/or "content".
+    """
+    from fu7ur3pr00f.gatherers.market import (
+        ContentTrendsGatherer,
+        JobMarketGatherer,
+        TechTrendsGatherer,
+    )
+
+    pending = {}
+    if source in ("all", "trends"):
+        pending["trends"] = TechTrendsGatherer().gather_with_cache(refresh=True)
+    if source in ("all", "jobs"):
+        pending["jobs"] = JobMarketGatherer().gather_with_cache(
+            refresh=True, role="Software Developer"
+        )
+    if source in ("all", "content"):
+        pending["content"] = ContentTrendsGatherer().gather_with_cache(
+            refresh=True, focus="all"
+        )
+
+    gathered = await asyncio.gather(*pending.values())
+    return dict(zip(pending, gathered))
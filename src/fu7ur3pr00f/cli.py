@@ -21,7 +21,6 @@ if "ctx" not in inspect.signature(_parameter.make_metavar).parameters:
     _parameter.make_metavar = _patched_make_metavar
 
 from . import __version__  # noqa: E402
-from .config import settings  # noqa: E402
 from .utils.console import console  # noqa: E402
 
 logger = logging.getLogger(__name__)
@@ -56,6 +55,9 @@ def main(
     ] = False,
 ) -> None:
     """FutureProof - Know thyself through your data."""
+    # Deferred so --help/--version never load pydantic-settings or read .env
+    from .config import settings
+
     settings.ensure_directories()
 
     # Initialize logging — file handler always active, console only shows warnings
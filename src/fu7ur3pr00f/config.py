@@ -1,6 +1,8 @@
 """Configuration management using pydantic-settings."""
 
+import os
 from collections.abc import Callable
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from dotenv import set_key
@@ -8,7 +10,18 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # User-level config lives alongside profile and memory data.
-_USER_ENV_PATH = Path.home() / ".fu7ur3pr00f" / ".env"
+_USER_DIR = Path.home() / ".fu7ur3pr00f"
+_USER_ENV_PATH = _USER_DIR / ".env"
+
+# Provider ID -> Settings flag that reports whether it is configured
+_PROVIDER_FLAGS = {
+    "fu7ur3pr00f": "has_proxy",
+    "openai": "has_openai",
+    "anthropic": "has_anthropic",
+    "google": "has_google",
+    "azure": "has_azure",
+    "ollama": "has_ollama",
+}
 
 
 class Settings(BaseSettings):
@@ -18,6 +31,7 @@ class Settings(BaseSettings):
         env_file=(".env", str(_USER_ENV_PATH)),
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # LLM Provider (auto-detected from available keys if empty)
@@ -47,10 +61,7 @@ class Settings(BaseSettings):
         """Strip AI Foundry project path and validate URL format."""
         if not v:
             return v
-        idx = v.find("/api/projects/")
-        if idx != -1:
-            v = v[:idx]
-        v = v.rstrip("/")
+        v = _clean_endpoint_value(v)
         if not v.startswith(("https://", "http://")):
             raise ValueError(
                 "Endpoint must be a URL starting with https:// "
@@ -111,7 +122,9 @@ class Settings(BaseSettings):
     knowledge_chunk_max_tokens: int = 500  # Max tokens per chunk
     knowledge_chunk_min_tokens: int = 50  # Min tokens per chunk (merge if smaller)
 
-    @property
+    # Credential flags below are memoized per instance; reload_settings()
+    # drops them via _clear_derived_flags() after swapping in new values.
+    @cached_property
     def github_mcp_token_resolved(self) -> str:
         """Get GitHub MCP token from various sources."""
         # Check explicit MCP token setting first
@@ -122,52 +135,50 @@ class Settings(BaseSettings):
             return self.github_personal_access_token
         return ""
 
-    @property
+    @cached_property
     def has_github_mcp(self) -> bool:
         """Check if GitHub MCP is configured."""
         return bool(self.github_mcp_token_resolved)
 
-    @property
+    @cached_property
     def has_proxy(self) -> bool:
         """Check if FutureProof proxy is configured."""
         return bool(self.fu7ur3pr00f_proxy_key)
 
-    @property
+    @cached_property
     def has_openai(self) -> bool:
         """Check if OpenAI is configured (key must start with sk-)."""
         return bool(self.openai_api_key and self.openai_api_key.startswith("sk-"))
 
-    @property
+    @cached_property
     def has_anthropic(self) -> bool:
         """Check if Anthropic is configured."""
         return bool(self.anthropic_api_key)
 
-    @property
+    @cached_property
     def has_google(self) -> bool:
         """Check if Google Gemini is configured."""
         return bool(self.google_api_key)
 
-    @property
+    @cached_property
     def has_azure(self) -> bool:
         """Check if Azure OpenAI is configured."""
         return bool(self.azure_openai_api_key and self.azure_openai_endpoint)
 
-    @property
+    @cached_property
     def has_ollama(self) -> bool:
         """Check if Ollama is configured."""
         return bool(self.ollama_base_url)
 
+    def _clear_derived_flags(self) -> None:
+        """Forget memoized credential flags so they track current field values."""
+        for name in _DERIVED_FLAGS:
+            self.__dict__.pop(name, None)
+
     def is_provider_configured(self, provider_id: str) -> bool:
         """Check if a provider has its required keys configured."""
-        checks = {
-            "fu7ur3pr00f": self.has_proxy,
-            "openai": self.has_openai,
-            "anthropic": self.has_anthropic,
-            "google": self.has_google,
-            "azure": self.has_azure,
-            "ollama": self.has_ollama,
-        }
-        return checks.get(provider_id, False)
+        flag = _PROVIDER_FLAGS.get(provider_id)
+        return bool(flag and getattr(self, flag))
 
     @property
     def active_provider(self) -> str:
@@ -192,33 +203,34 @@ class Settings(BaseSettings):
             return "ollama"
         return ""
 
-    @property
+    @cached_property
     def has_tavily_mcp(self) -> bool:
         """Check if Tavily Search MCP is configured."""
         return bool(self.tavily_api_key)
 
-    @property
+    # Paths (user-level, under ~/.fu7ur3pr00f/). They never depend on field
+    # values, so each is computed once per instance and survives reload_settings().
+    @cached_property
+    def data_dir(self) -> Path:
+        """Get the data directory (~/.fu7ur3pr00f/data/)."""
+        return _USER_DIR / "data"
+
+    @cached_property
     def market_cache_dir(self) -> Path:
         """Get the market data cache directory."""
         return self.data_dir / "cache" / "market"
 
-    # Paths (user-level, under ~/.fu7ur3pr00f/)
-    @property
-    def data_dir(self) -> Path:
-        """Get the data directory (~/.fu7ur3pr00f/data/)."""
-        return Path.home() / ".fu7ur3pr00f" / "data"
-
-    @property
+    @cached_property
     def raw_dir(self) -> Path:
         """Get the raw data directory."""
         return self.data_dir / "raw"
 
-    @property
+    @cached_property
     def processed_dir(self) -> Path:
         """Get the processed data directory."""
         return self.data_dir / "processed"
 
-    @property
+    @cached_property
     def output_dir(self) -> Path:
         """Get the output directory."""
         return self.data_dir / "output"
@@ -227,12 +239,49 @@ class Settings(BaseSettings):
         """Create all required directories with restrictive permissions."""
         from fu7ur3pr00f.utils.security import secure_mkdir
 
-        for dir_path in [self.raw_dir, self.processed_dir, self.output_dir]:
-            secure_mkdir(dir_path)
+        root = str(self.data_dir)
+        for sub in ("raw", "processed", "output"):
+            secure_mkdir(os.path.join(root, sub))
+
+
+# Memoized Settings properties that depend on field values: every
+# cached_property except the paths, so a new flag is cleared on reload too
+_DERIVED_FLAGS = tuple(
+    name
+    for name, attr in vars(Settings).items()
+    if isinstance(attr, cached_property) and attr.func.__annotations__.get("return") is not Path
+)
+
+
+def _existing_env_files() -> tuple[str, ...]:
+    """Return the env files that currently exist, in load order.
+
+    Checked with ``os.path`` so missing files never reach pydantic-settings'
+    ``Path``-based lookup; the user file is re-checked on every call because
+    ``write_user_setting`` may create it after startup.
+    """
+    candidates = (".env", str(_USER_ENV_PATH))
+    return tuple(os.path.abspath(f) for f in candidates if os.path.isfile(f))
+
+
+def _load_settings() -> Settings:
+    """Build a Settings instance from the env files present right now."""
+    return Settings(_env_file=_existing_env_files())  # type: ignore[call-arg]
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, building it on first use."""
+    return _load_settings()
+
+
+def __getattr__(name: str) -> Settings:
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module 'fu7ur3pr00f.config' has no attribute {name!r}")
 
 
-# Global settings instance
-settings = Settings()
+settings: Settings  # populated lazily via __getattr__
 
 
 def get_user_env_path() -> Path:
@@ -276,6 +325,9 @@ def reload_settings() -> None:
     All modules that imported ``settings`` by name keep their reference to
     the same object, so mutating it ensures everyone sees the new values.
     """
-    new = Settings()
+    current = get_settings()
+    new = _load_settings()
+    # Settings is frozen; reload is the one sanctioned in-place update.
     for field_name in Settings.model_fields:
-        setattr(settings, field_name, getattr(new, field_name))
+        object.__setattr__(current, field_name, getattr(new, field_name))
+    current._clear_derived_flags()
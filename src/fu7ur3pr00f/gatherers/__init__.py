@@ -1,9 +1,31 @@
 """Data gatherers for various professional platforms."""
 
-from .cliftonstrengths import CliftonStrengthsGatherer
-from .cv import CVGatherer
-from .linkedin import LinkedInGatherer
-from .portfolio import PortfolioGatherer
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cliftonstrengths import CliftonStrengthsGatherer
+    from .cv import CVGatherer
+    from .linkedin import LinkedInGatherer
+    from .portfolio import PortfolioGatherer
+
+# Gatherers are imported on first access so that loading a sibling package
+# (e.g. gatherers.market) does not pull in every scraper and parser.
+_GATHERER_MAP = {
+    "CliftonStrengthsGatherer": ".cliftonstrengths",
+    "CVGatherer": ".cv",
+    "LinkedInGatherer": ".linkedin",
+    "PortfolioGatherer": ".portfolio",
+}
+
+
+def __getattr__(name: str) -> type:
+    if name in _GATHERER_MAP:
+        value = getattr(import_module(_GATHERER_MAP[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'fu7ur3pr00f.gatherers' has no attribute {name!r}")
+
 
 __all__ = [
     "CliftonStrengthsGatherer",
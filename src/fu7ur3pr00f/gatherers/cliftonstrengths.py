@@ -11,10 +11,15 @@ Supports multiple report types:
 """
 
 import logging
+import os
 import re
 import shutil
 import subprocess  # nosec B404 — required for pdftotext CLI
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from ..memory.chunker import Section
@@ -86,8 +91,149 @@ STRENGTH_TO_DOMAIN = {
     strength: domain for domain, strengths in DOMAINS.items() for strength in strengths
 }
 
+# Reports carrying the ranked list and per-theme detail sections, richest first
+RANKING_REPORTS = ("all_34", "top_10", "top_5")
 
-@dataclass
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation of words, factored into a prefix trie.
+
+    ``["Achiever", "Activator"]`` becomes ``Ac(?:hiever|tivator)``, so the
+    engine branches once per shared prefix instead of retrying every word.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end-of-word marker
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A word ending here makes the longer continuations optional
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    return build(trie)
+
+
+# Filename markers checked in priority order: TOP_5 before the TOP_10-based
+# reports, and the specific TOP_10 variants before generic TOP_10
+_REPORT_TYPE_MARKERS = (
+    ("ALL_34", "all_34"),
+    ("TOP_5", "top_5"),
+    ("ACTION_PLANNING", "action_planning"),
+    ("LEADERSHIP", "leadership"),
+    ("DISCOVERY", "discovery"),
+    ("TOP_10", "top_10"),
+)
+
+# Static patterns, compiled once at import time
+_GALLUP_INDICATOR_RE = re.compile("|".join(map(re.escape, GALLUP_PDF_INDICATORS)))
+# Bullet glyphs pdftotext emits, folded onto "•"; zero-width spaces dropped
+_BULLET_TRANSLATION = str.maketrans({"●": "•", "∙": "•", "\u200b": None})
+_SECTION_HEADER_RE = re.compile(r"(\d+)\.\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s*®?")
+_REGISTERED_NAME_RE = re.compile(r"(\w+(?:-\w+)?)\s+®")
+_NEXT_REGISTERED_NAME_RE = re.compile(r"\n\s*\w+(?:-\w+)?\s+®")
+_NAME_DATE_RE = re.compile(r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*\|\s*(\d{2}-\d{2}-\d{4})")
+
+_INSIGHT_OPENER_RE = re.compile(
+    r"(?=Chances are good that|Driven by your talents|Because of your strengths"
+    r"|It's very likely that|Instinctively|By nature)"
+)
+_COPYRIGHT_RE = re.compile(
+    r"\d*\s*\n?\s*StrengthsFinder.*?reserved\.\s*\n?", re.DOTALL | re.IGNORECASE
+)
+_REPORT_ID_RE = re.compile(r"101360652.*?\n")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+_SECTION_I_RE = re.compile(r"Section I:\s*Awareness")
+_SECTION_II_RE = re.compile(r"Section II:\s*Application")
+_SECTION_III_RE = re.compile(r"Section III:\s*Achievement")
+_STANDOUT_RE = re.compile(r"What makes you stand out\?")
+_NEXT_SOUNDS_LIKE_RE = re.compile(r"[A-Z][A-Z-]+\s+SOUNDS LIKE THIS:|QUESTIONS")
+_QUOTE_ATTRIBUTION_RE = re.compile(r"(?=\n[A-Z][a-z]+\s+[A-Z]\.?,\s+)")
+_PERSONALIZED_HEADER_RE = re.compile(r"Your Personalized Strengths Insights")
+# Every "StrengthName\nIDEAS FOR ACTION" header in Action Planning Section II
+_IDEAS_FOR_ACTION_RE = re.compile(
+    rf"(?:^|\n)\s*({_trie_pattern(STRENGTH_TO_DOMAIN)})\s*\n\s*IDEAS FOR ACTION",
+    re.IGNORECASE,
+)
+
+_DESCRIPTION_RE = re.compile(r"HOW YOU CAN THRIVE\s*(.*?)(?:WHY YOUR|$)", re.DOTALL | re.IGNORECASE)
+_WHY_SUCCEED_RE = re.compile(
+    r"WHY YOU SUCCEED.*?\n\s*(.*?)(?:TAKE ACTION|$)", re.DOTALL | re.IGNORECASE
+)
+_TAKE_ACTION_RE = re.compile(r"TAKE ACTION.*?\n(.*?)(?:WATCH OUT|$)", re.DOTALL | re.IGNORECASE)
+_BLIND_SPOTS_RE = re.compile(
+    r"WATCH OUT FOR BLIND SPOTS\s*(.*?)(?=\d+\.\s+[A-Z]|StrengthsFinder|$)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _find_strength_headers(text: str) -> tuple[re.Match[str], ...]:
+    """Find every "N. StrengthName" header in a report.
+
+    Ranking reports need these matches twice, once for the ranked list and
+    once to split the detail sections, so gather() scans once and passes
+    the result to both.
+    """
+    return tuple(_SECTION_HEADER_RE.finditer(text))
+
+
+# Per-strength patterns. Names come from the fixed set of 34 themes, so each
+# cache fills once and is then reused across sections and reports.
+
+
+@lru_cache(maxsize=64)
+def _insights_block_re(name: str) -> re.Pattern[str]:
+    """Action Planning Section I: "Name ... YOUR PERSONALIZED STRENGTHS INSIGHTS"."""
+    return re.compile(
+        rf"{re.escape(name)}\s*\n.*?YOUR PERSONALIZED STRENGTHS INSIGHTS",
+        re.DOTALL | re.IGNORECASE,
+    )
+
+
+@lru_cache(maxsize=64)
+def _sounds_like_re(name: str) -> re.Pattern[str]:
+    """Action Planning Section III: "NAME SOUNDS LIKE THIS:"."""
+    return re.compile(rf"{re.escape(name.upper())}\s+SOUNDS LIKE THIS:", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _leadership_header_re(name: str) -> re.Pattern[str]:
+    """Leadership Insight per-theme header: "NAME ®"."""
+    return re.compile(rf"{re.escape(name.upper())}\s+", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _action_items_re(name: str) -> re.Pattern[str]:
+    """Discovery Development: "Name ... ACTION ITEMS"."""
+    return re.compile(rf"{re.escape(name)}\s+.*?ACTION ITEMS\s*\n", re.DOTALL | re.IGNORECASE)
+
+
+def find_gallup_pdfs(input_dir: Path) -> list[Path]:
+    """List the Gallup CliftonStrengths PDFs in a directory.
+
+    A single scandir pass: only entries whose name looks like a Gallup report
+    are turned into Path objects. A missing directory yields no reports.
+    """
+    try:
+        with os.scandir(input_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".pdf")
+                and _GALLUP_INDICATOR_RE.search(entry.name.lower())
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+@dataclass(slots=True)
 class StrengthInsight:
     """Parsed insight for a single strength."""
 
@@ -102,7 +248,7 @@ class StrengthInsight:
     sounds_like_quotes: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CliftonStrengthsData:
     """Parsed CliftonStrengths assessment data."""
 
@@ -137,8 +283,7 @@ class CliftonStrengthsGatherer:
 
         logger.info(f"Gathering CliftonStrengths data from {input_dir}")
 
-        pdf_files = list(input_dir.glob("*.pdf"))
-        gallup_pdfs = [p for p in pdf_files if self._is_gallup_pdf(p)]
+        gallup_pdfs = find_gallup_pdfs(input_dir)
 
         if not gallup_pdfs:
             raise FileNotFoundError(f"No Gallup CliftonStrengths PDFs found in {input_dir}")
@@ -147,27 +292,69 @@ class CliftonStrengthsGatherer:
 
         data = CliftonStrengthsData()
 
-        for pdf_path in gallup_pdfs:
-            self._parse_pdf(pdf_path, data)
+        # Ranking reports are parsed first so per-theme details come from the
+        # richest one, before Action Planning and friends refine them.
+        gallup_pdfs.sort(key=self._report_priority)
+        details_found = False
+
+        ranking_pdfs = [p for p in gallup_pdfs if self._report_priority(p) < len(RANKING_REPORTS)]
+        other_pdfs = gallup_pdfs[len(ranking_pdfs) :]
+
+        # Each extraction is a pdftotext subprocess, so the other reports are
+        # extracted in the background while the ranking reports are handled one
+        # by one; a ranking report a richer one already covered is never
+        # extracted. Parsing stays sequential, in priority order, and consumes
+        # texts as they arrive so each one is released once parsed.
+        with ThreadPoolExecutor(max_workers=min(8, len(gallup_pdfs))) as pool:
+            other_texts = pool.map(self._extract_text, other_pdfs)
+            for pdf_path in ranking_pdfs:
+                if self._is_redundant_ranking(pdf_path, data, details_found):
+                    logger.info(f"Skipping {pdf_path.name}: covered by a richer report")
+                    continue
+                text = self._extract_text(pdf_path)
+                headers = _find_strength_headers(text)
+                self._parse_pdf(pdf_path, text, data, headers)
+                if text and not details_found:
+                    details_found = self._parse_strength_details(text, data, headers)
+            for pdf_path, text in zip(other_pdfs, other_texts):
+                self._parse_pdf(pdf_path, text, data)
 
         # Determine dominant domain from top 5
         if data.top_5:
-            domain_counts: dict[str, int] = {}
-            for strength in data.top_5:
-                domain_counts[strength.domain] = domain_counts.get(strength.domain, 0) + 1
-            data.dominant_domain = max(domain_counts, key=lambda d: domain_counts[d])
+            domain_counts = Counter(strength.domain for strength in data.top_5)
+            data.dominant_domain = domain_counts.most_common(1)[0][0]
 
         sections = self._build_sections(data)
 
         logger.info("CliftonStrengths data gathered successfully")
         return sections
 
-    def _is_gallup_pdf(self, path: Path) -> bool:
-        """Check if a PDF is a Gallup CliftonStrengths report."""
-        name = path.name.lower()
-        return any(indicator in name for indicator in GALLUP_PDF_INDICATORS)
+    def _report_priority(self, path: Path) -> int:
+        """Sort key placing ranking reports first (richest first), then the rest."""
+        report_type = self._get_report_type(path.name.upper())
+        if report_type in RANKING_REPORTS:
+            return RANKING_REPORTS.index(report_type)
+        return len(RANKING_REPORTS)
+
+    def _is_redundant_ranking(
+        self, path: Path, data: CliftonStrengthsData, details_found: bool
+    ) -> bool:
+        """Check if a Top 5/Top 10 report would add nothing to the parsed data.
 
-    def _extract_ranked_strengths(self, text: str, max_rank: int = 34) -> list[StrengthInsight]:
+        Ranking reports are handled richest first, so once the name, rankings
+        and per-theme details are known, a smaller ranking report is a no-op.
+        """
+        if not (details_found and data.name and data.top_5):
+            return False
+        report_type = self._get_report_type(path.name.upper())
+        return report_type == "top_5" or (report_type == "top_10" and bool(data.top_10))
+
+    def _extract_ranked_strengths(
+        self,
+        text: str,
+        max_rank: int = 34,
+        headers: tuple[re.Match[str], ...] | None = None,
+    ) -> list[StrengthInsight]:
         """Extract ranked strengths from text into StrengthInsight objects.
 
         Parses "N. StrengthName" patterns, filters valid CliftonStrengths names,
@@ -176,27 +363,28 @@ class CliftonStrengthsGatherer:
         Args:
             text: Text containing ranked strength patterns
             max_rank: Maximum rank to include (5 for top_5, 10 for top_10, etc.)
+            headers: Header matches already found in text, scanned if omitted
 
         Returns:
             Sorted list of StrengthInsight objects
         """
-        pattern = r"(\d{1,2})\.\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)"
-        matches = re.findall(pattern, text)
         seen: set[int] = set()
         results: list[StrengthInsight] = []
 
-        for rank_str, name in matches:
-            rank = int(rank_str)
-            name = name.strip()
-            if name in STRENGTH_TO_DOMAIN and rank not in seen and rank <= max_rank:
-                seen.add(rank)
-                results.append(
-                    StrengthInsight(
-                        rank=rank,
-                        name=name,
-                        domain=STRENGTH_TO_DOMAIN.get(name, "Unknown"),
-                    )
-                )
+        if headers is None:
+            headers = _find_strength_headers(text)
+
+        domain_of = STRENGTH_TO_DOMAIN.get
+        for match in headers:
+            rank = int(match.group(1))
+            name = match.group(2)
+            domain = domain_of(name)
+            if domain is None or rank in seen or not 1 <= rank <= max_rank:
+                continue
+            seen.add(rank)
+            results.append(StrengthInsight(rank=rank, name=name, domain=domain))
+            if len(results) == max_rank:
+                break  # every rank is filled; the rest is detail-section headers
 
         results.sort(key=lambda x: x.rank)
         return results
@@ -208,25 +396,32 @@ class CliftonStrengthsGatherer:
             logger.error("pdftotext not found. Install poppler-utils.")
             return ""
         try:
+            # Ask for UTF-8 explicitly and decode the bytes ourselves rather than
+            # going through the locale-dependent text=True path
             result = subprocess.run(  # nosec B603 — pdftotext resolved via which()
-                [pdftotext_path, "-layout", str(pdf_path), "-"],
+                [pdftotext_path, "-layout", "-enc", "UTF-8", str(pdf_path), "-"],
                 capture_output=True,
-                text=True,
                 timeout=30,
             )
             if result.returncode == 0:
-                return result.stdout
+                return result.stdout.decode("utf-8", errors="replace")
             else:
-                logger.warning(f"pdftotext failed for {pdf_path}: {result.stderr}")
+                stderr = result.stderr.decode("utf-8", errors="replace")
+                logger.warning(f"pdftotext failed for {pdf_path}: {stderr}")
                 return ""
         except subprocess.TimeoutExpired:
             logger.error(f"Timeout extracting text from {pdf_path}")
             return ""
 
-    def _parse_pdf(self, pdf_path: Path, data: CliftonStrengthsData) -> None:
-        """Parse a single PDF and update the data object."""
+    def _parse_pdf(
+        self,
+        pdf_path: Path,
+        text: str,
+        data: CliftonStrengthsData,
+        headers: tuple[re.Match[str], ...] | None = None,
+    ) -> None:
+        """Parse the extracted text of a single PDF and update the data object."""
         filename = pdf_path.name.upper()
-        text = self._extract_text(pdf_path)
 
         if not text:
             logger.warning(f"No text extracted from {pdf_path}")
@@ -235,16 +430,16 @@ class CliftonStrengthsGatherer:
         report_type = self._get_report_type(filename)
 
         # Extract name and date
-        name_match = re.search(r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*\|\s*(\d{2}-\d{2}-\d{4})", text)
+        name_match = _NAME_DATE_RE.search(text)
         if name_match and not data.name:
             data.name = name_match.group(1).strip()
             data.date = name_match.group(2).strip()
 
         # Parse based on report type (specific types before generic TOP_10)
         if report_type == "all_34":
-            self._parse_all_34(text, data)
+            self._parse_all_34(text, data, headers)
         elif report_type == "top_5":
-            self._parse_top_5(text, data)
+            self._parse_top_5(text, data, headers)
         elif report_type == "action_planning":
             self._parse_action_planning(text, data)
         elif report_type == "leadership":
@@ -252,28 +447,25 @@ class CliftonStrengthsGatherer:
         elif report_type == "discovery":
             self._parse_discovery_development(text, data)
         elif report_type == "top_10":
-            self._parse_top_10(text, data)
-
-    def _get_report_type(self, filename: str) -> str:
-        """Determine report type from filename."""
-        if "ALL_34" in filename:
-            return "all_34"
-        elif "SF_TOP_5" in filename or "TOP_5" in filename.replace("TOP_10", ""):
-            return "top_5"
-        # Specific TOP_10 variants must be checked BEFORE generic TOP_10
-        elif "ACTION_PLANNING" in filename:
-            return "action_planning"
-        elif "LEADERSHIP" in filename:
-            return "leadership"
-        elif "DISCOVERY" in filename:
-            return "discovery"
-        elif "TOP_10" in filename:
-            return "top_10"
+            self._parse_top_10(text, data, headers)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_report_type(filename: str) -> str:
+        """Determine report type from filename (cached; it is a sort and dispatch key)."""
+        for marker, report_type in _REPORT_TYPE_MARKERS:
+            if marker in filename:
+                return report_type
         return "unknown"
 
-    def _parse_all_34(self, text: str, data: CliftonStrengthsData) -> None:
+    def _parse_all_34(
+        self,
+        text: str,
+        data: CliftonStrengthsData,
+        headers: tuple[re.Match[str], ...] | None = None,
+    ) -> None:
         """Parse the All 34 report for complete strength ranking."""
-        all_strengths = self._extract_ranked_strengths(text)
+        all_strengths = self._extract_ranked_strengths(text, headers=headers)
         data.all_34 = [s.name for s in all_strengths]
 
         # Also populate top_5 and top_10 if not already done
@@ -283,34 +475,41 @@ class CliftonStrengthsGatherer:
         if not data.top_10 and len(data.all_34) >= 10:
             data.top_10 = list(all_strengths[:10])
 
-        # Parse detailed insights for each strength
-        self._parse_strength_details(text, data)
-
-    def _parse_top_5(self, text: str, data: CliftonStrengthsData) -> None:
+    def _parse_top_5(
+        self,
+        text: str,
+        data: CliftonStrengthsData,
+        headers: tuple[re.Match[str], ...] | None = None,
+    ) -> None:
         """Parse Top 5 report."""
         if data.top_5:
             return
 
-        data.top_5 = self._extract_ranked_strengths(text, max_rank=5)
-        self._parse_strength_details(text, data)
+        data.top_5 = self._extract_ranked_strengths(text, max_rank=5, headers=headers)
 
-    def _parse_top_10(self, text: str, data: CliftonStrengthsData) -> None:
+    def _parse_top_10(
+        self,
+        text: str,
+        data: CliftonStrengthsData,
+        headers: tuple[re.Match[str], ...] | None = None,
+    ) -> None:
         """Parse Top 10 report."""
-        if data.top_10:
-            return
-
-        data.top_10 = self._extract_ranked_strengths(text, max_rank=10)
-        self._parse_strength_details(text, data)
+        self._ensure_top_10(text, data, headers)
 
     # -----------------------------------------------------------------
     # Action Planning / Leadership / Discovery parsers
     # -----------------------------------------------------------------
 
-    def _ensure_top_10(self, text: str, data: CliftonStrengthsData) -> None:
+    def _ensure_top_10(
+        self,
+        text: str,
+        data: CliftonStrengthsData,
+        headers: tuple[re.Match[str], ...] | None = None,
+    ) -> None:
         """Populate top_10 from a ranked list in text if not already done."""
         if data.top_10:
             return
-        data.top_10 = self._extract_ranked_strengths(text, max_rank=10)
+        data.top_10 = self._extract_ranked_strengths(text, max_rank=10, headers=headers)
         if not data.top_5 and len(data.top_10) >= 5:
             data.top_5 = list(data.top_10[:5])
 
@@ -320,29 +519,14 @@ class CliftonStrengthsGatherer:
         Each paragraph typically starts with one of these openers:
         "Chances are good that", "Driven by your talents", etc.
         """
-        openers = [
-            r"Chances are good that",
-            r"Driven by your talents",
-            r"Because of your strengths",
-            r"It's very likely that",
-            r"Instinctively",
-            r"By nature",
-        ]
-        pattern = r"(?=" + "|".join(openers) + r")"
-        parts = re.split(pattern, text)
+        parts = _INSIGHT_OPENER_RE.split(text)
         return [p.strip() for p in parts if p.strip() and len(p.strip()) > 30]
 
     def _clean_copyright(self, text: str) -> str:
         """Remove copyright lines and page numbers from extracted PDF text."""
-        text = re.sub(
-            r"\d*\s*\n?\s*StrengthsFinder.*?reserved\.\s*\n?",
-            " ",
-            text,
-            flags=re.DOTALL | re.IGNORECASE,
-        )
-        text = re.sub(r"101360652.*?\n", " ", text)
-        text = re.sub(r"®", "", text)
-        return text
+        text = _COPYRIGHT_RE.sub(" ", text)
+        text = _REPORT_ID_RE.sub(" ", text)
+        return text.replace("®", "")
 
     def _parse_action_planning(self, text: str, data: CliftonStrengthsData) -> None:
         """Parse Action Planning Top 10 report.
@@ -353,45 +537,43 @@ class CliftonStrengthsGatherer:
         - Section III: "Sounds Like This" quotes (sounds_like_quotes)
         """
         self._ensure_top_10(text, data)
-        self._parse_ap_personalized_insights(text, data)
-        self._parse_ap_ideas_for_action(text, data)
-        self._parse_ap_sounds_like(text, data)
+
+        # Locate the three section markers once; each helper gets its own
+        # copyright-cleaned slice
+        section_i = _SECTION_I_RE.search(text)
+        section_ii = _SECTION_II_RE.search(text)
+        section_iii = _SECTION_III_RE.search(text)
+        section_ii_start = section_ii.start() if section_ii else len(text)
+        section_iii_start = section_iii.start() if section_iii else len(text)
+
+        if section_i:
+            section_text = text[section_i.end() : section_ii_start]
+            self._parse_ap_personalized_insights(self._clean_copyright(section_text), data)
+        if section_ii:
+            section_text = text[section_ii.end() : section_iii_start]
+            self._parse_ap_ideas_for_action(self._clean_copyright(section_text), data)
+        if section_iii:
+            section_text = text[section_iii.end() :]
+            self._parse_ap_sounds_like(self._clean_copyright(section_text), data)
 
     def _parse_ap_personalized_insights(
         self,
-        text: str,
+        section_text: str,
         data: CliftonStrengthsData,
     ) -> None:
         """Parse Section I — personalized insights for each strength."""
-        section_i = re.search(r"Section I:\s*Awareness", text)
-        section_ii = re.search(r"Section II:\s*Application", text)
-        if not section_i:
-            return
-
-        start = section_i.end()
-        end = section_ii.start() if section_ii else len(text)
-        section_text = self._clean_copyright(text[start:end])
-
         for insight in data.top_10:
             # Find this strength's personalized insights block
-            pattern = re.compile(
-                rf"{re.escape(insight.name)}\s*\n.*?"
-                r"YOUR PERSONALIZED STRENGTHS INSIGHTS",
-                re.DOTALL | re.IGNORECASE,
-            )
-            match = pattern.search(section_text)
+            match = _insights_block_re(insight.name).search(section_text)
             if not match:
                 continue
 
             # Extract from after "What makes you stand out?" to next "QUESTIONS"
             block_start = match.end()
             # Skip the "What makes you stand out?" header if present
-            standout = re.search(
-                r"What makes you stand out\?",
-                section_text[block_start:],
-            )
-            if standout and standout.start() < 50:
-                block_start += standout.end()
+            standout = _STANDOUT_RE.search(section_text, block_start)
+            if standout and standout.start() - block_start < 50:
+                block_start = standout.end()
 
             questions_pos = section_text.find("QUESTIONS", block_start)
             if questions_pos == -1:
@@ -400,35 +582,27 @@ class CliftonStrengthsGatherer:
             raw = section_text[block_start:questions_pos]
             paragraphs = self._split_personalized_insights(raw)
             if paragraphs:
-                insight.unique_insights = [self._clean_text(p) for p in paragraphs]
+                insight.unique_insights = [self._collapse_text(p) for p in paragraphs]
 
     def _parse_ap_ideas_for_action(
         self,
-        text: str,
+        section_text: str,
         data: CliftonStrengthsData,
     ) -> None:
         """Parse Section II — 10 Ideas for Action per strength."""
-        section_ii = re.search(r"Section II:\s*Application", text)
-        section_iii = re.search(r"Section III:\s*Achievement", text)
-        if not section_ii:
-            return
-
-        start = section_ii.end()
-        end = section_iii.start() if section_iii else len(text)
-        section_text = self._clean_copyright(text[start:end])
+        # Locate every "StrengthName\nIDEAS FOR ACTION" header in one pass,
+        # keeping the first one per strength
+        header_starts: dict[str, int] = {}
+        for match in _IDEAS_FOR_ACTION_RE.finditer(section_text):
+            header_starts.setdefault(match.group(1).lower(), match.start())
 
         for insight in data.top_10:
-            # Find "StrengthName\nIDEAS FOR ACTION"
-            pattern = re.compile(
-                rf"(?:^|\n)\s*{re.escape(insight.name)}\s*\n\s*IDEAS FOR ACTION",
-                re.IGNORECASE,
-            )
-            match = pattern.search(section_text)
-            if not match:
+            header_start = header_starts.get(insight.name.lower())
+            if header_start is None:
                 continue
 
             # Extract from after "IDEAS FOR ACTION" to next "QUESTIONS"
-            ideas_start = section_text.find("IDEAS FOR ACTION", match.start())
+            ideas_start = section_text.find("IDEAS FOR ACTION", header_start)
             ideas_start = section_text.find("\n", ideas_start) + 1
 
             questions_pos = section_text.find("QUESTIONS", ideas_start)
@@ -439,8 +613,8 @@ class CliftonStrengthsGatherer:
 
             # Split into individual action items by paragraph breaks
             items = [
-                self._clean_text(item)
-                for item in re.split(r"\n\s*\n", raw)
+                self._collapse_text(item)
+                for item in _PARAGRAPH_BREAK_RE.split(raw)
                 if item.strip() and len(item.strip()) > 30
             ]
 
@@ -450,43 +624,27 @@ class CliftonStrengthsGatherer:
 
     def _parse_ap_sounds_like(
         self,
-        text: str,
+        section_text: str,
         data: CliftonStrengthsData,
     ) -> None:
         """Parse Section III — 'Sounds Like This' real quotes per strength."""
-        section_iii = re.search(r"Section III:\s*Achievement", text)
-        if not section_iii:
-            return
-
-        section_text = self._clean_copyright(text[section_iii.end() :])
-
         for insight in data.top_10:
             # Find "[STRENGTH] SOUNDS LIKE THIS:"
-            pattern = re.compile(
-                rf"{re.escape(insight.name.upper())}\s+SOUNDS LIKE THIS:",
-                re.IGNORECASE,
-            )
-            match = pattern.search(section_text)
+            match = _sounds_like_re(insight.name).search(section_text)
             if not match:
                 continue
 
             # Find end: next "SOUNDS LIKE THIS:" or "QUESTIONS" or end
-            remaining = section_text[match.end() :]
-            next_marker = re.search(
-                r"[A-Z][A-Z-]+\s+SOUNDS LIKE THIS:|QUESTIONS",
-                remaining,
-            )
-            raw = remaining[: next_marker.start()] if next_marker else remaining
+            next_marker = _NEXT_SOUNDS_LIKE_RE.search(section_text, match.end())
+            end = next_marker.start() if next_marker else len(section_text)
+            raw = section_text[match.end() : end]
 
             # Split into individual quotes by attribution pattern:
             # "FirstName L., title:"
-            quote_splits = re.split(
-                r"(?=\n[A-Z][a-z]+\s+[A-Z]\.?,\s+)",
-                raw,
-            )
+            quote_splits = _QUOTE_ATTRIBUTION_RE.split(raw)
             quotes = []
             for part in quote_splits:
-                cleaned = self._clean_text(part)
+                cleaned = self._collapse_text(part)
                 if cleaned and len(cleaned) > 40:
                     quotes.append(cleaned)
 
@@ -512,7 +670,7 @@ class CliftonStrengthsGatherer:
             return
 
         # Find "Your Personalized Strengths Insights" header
-        header = re.search(r"Your Personalized Strengths Insights", text)
+        header = _PERSONALIZED_HEADER_RE.search(text)
         if not header:
             return
 
@@ -520,24 +678,17 @@ class CliftonStrengthsGatherer:
 
         for i, insight in enumerate(data.top_10):
             # Headers are "STRENGTH ®" (uppercase)
-            pattern = re.compile(
-                rf"{re.escape(insight.name.upper())}\s+",
-                re.IGNORECASE,
-            )
-            match = pattern.search(section_text)
+            match = _leadership_header_re(insight.name).search(section_text)
             if not match:
                 continue
 
             # Find end: next strength header or COPYRIGHT STANDARDS
             end_pos = len(section_text)
             if i + 1 < len(data.top_10):
-                next_pattern = re.compile(
-                    rf"{re.escape(data.top_10[i + 1].name.upper())}\s+",
-                    re.IGNORECASE,
-                )
-                next_match = next_pattern.search(section_text[match.end() :])
+                next_pattern = _leadership_header_re(data.top_10[i + 1].name)
+                next_match = next_pattern.search(section_text, match.end())
                 if next_match:
-                    end_pos = match.end() + next_match.start()
+                    end_pos = next_match.start()
 
             copyright_pos = section_text.find("COPYRIGHT STANDARDS", match.end())
             if copyright_pos != -1 and copyright_pos < end_pos:
@@ -546,7 +697,7 @@ class CliftonStrengthsGatherer:
             raw = section_text[match.end() : end_pos]
             paragraphs = self._split_personalized_insights(raw)
             if paragraphs:
-                insight.unique_insights = [self._clean_text(p) for p in paragraphs]
+                insight.unique_insights = [self._collapse_text(p) for p in paragraphs]
 
     def _parse_discovery_development(
         self,
@@ -560,22 +711,16 @@ class CliftonStrengthsGatherer:
         # Ensure top_5 exists
         if not data.top_5:
             # Extract from "StrengthName ®" headers
-            strength_pattern = r"(\w+(?:-\w+)?)\s+®"
-            matches = re.findall(strength_pattern, text)
+            matches = _REGISTERED_NAME_RE.findall(text)
             seen: set[str] = set()
             rank = 1
             for name in matches:
-                name = name.strip()
-                if name in STRENGTH_TO_DOMAIN and name not in seen and rank <= 5:
-                    seen.add(name)
-                    data.top_5.append(
-                        StrengthInsight(
-                            rank=rank,
-                            name=name,
-                            domain=STRENGTH_TO_DOMAIN.get(name, "Unknown"),
-                        )
-                    )
-                    rank += 1
+                domain = STRENGTH_TO_DOMAIN.get(name)
+                if domain is None or name in seen or rank > 5:
+                    continue
+                seen.add(name)
+                data.top_5.append(StrengthInsight(rank=rank, name=name, domain=domain))
+                rank += 1
 
         # Skip if action items already rich (from Action Planning)
         if any(len(s.action_items) > 5 for s in data.top_5):
@@ -588,125 +733,121 @@ class CliftonStrengthsGatherer:
 
         for insight in data.top_5:
             # Find "ACTION ITEMS" after strength name
-            pattern = re.compile(
-                rf"{re.escape(insight.name)}\s+.*?ACTION ITEMS\s*\n",
-                re.DOTALL | re.IGNORECASE,
-            )
-            match = pattern.search(section_text)
+            match = _action_items_re(insight.name).search(section_text)
             if not match:
                 continue
 
             # Find end: next "StrengthName ®" header or end of text
-            remaining = section_text[match.end() :]
-            next_strength = re.search(r"\n\s*\w+(?:-\w+)?\s+®", remaining)
-            raw = remaining[: next_strength.start()] if next_strength else remaining
+            next_strength = _NEXT_REGISTERED_NAME_RE.search(section_text, match.end())
+            end = next_strength.start() if next_strength else len(section_text)
+            raw = section_text[match.end() : end]
 
             items = [
-                self._clean_text(item)
-                for item in re.split(r"\n\s*\n", raw)
+                self._collapse_text(item)
+                for item in _PARAGRAPH_BREAK_RE.split(raw)
                 if item.strip() and len(item.strip()) > 30
             ]
 
             if items:
                 insight.action_items = items
 
-    def _parse_strength_details(self, text: str, data: CliftonStrengthsData) -> None:
-        """Parse detailed insights for each strength from text."""
+    def _parse_strength_details(
+        self,
+        text: str,
+        data: CliftonStrengthsData,
+        headers: tuple[re.Match[str], ...] | None = None,
+    ) -> bool:
+        """Parse detailed insights for each top 5 strength from text.
+
+        Args:
+            text: Report text
+            data: Data whose top 5 strengths receive the details
+            headers: Header matches already found in text, scanned if omitted
+
+        Returns:
+            True if a detail section was found for at least one strength
+        """
         # Split text into sections by strength headers
         # Pattern matches "N. StrengthName" at the start of a strength section
-        strength_sections = self._split_into_strength_sections(text)
+        strength_sections = self._split_into_strength_sections(text, headers)
+
+        # Fallback lookup by name alone, for sections ranked differently
+        sections_by_name: dict[str, str] = {}
+        for key, section in strength_sections.items():
+            sections_by_name.setdefault(key.partition(". ")[2].lower(), section)
 
         # For each strength in top_5, try to find its details
+        found = False
         for insight in data.top_5:
             section_key = f"{insight.rank}. {insight.name}"
-            section = strength_sections.get(section_key, "")
-
-            if not section:
-                # Try alternate key formats
-                for key in strength_sections:
-                    if insight.name.lower() in key.lower():
-                        section = strength_sections[key]
-                        break
+            section = strength_sections.get(section_key) or sections_by_name.get(
+                insight.name.lower(), ""
+            )
 
             if section:
                 self._extract_strength_insight(section, insight)
+                found = True
+
+        return found
 
-    def _split_into_strength_sections(self, text: str) -> dict[str, str]:
+    def _split_into_strength_sections(
+        self, text: str, headers: tuple[re.Match[str], ...] | None = None
+    ) -> dict[str, str]:
         """Split text into sections keyed by strength name."""
         sections: dict[str, str] = {}
 
         # Find all strength section headers (e.g., "1. Learner", "2. Woo")
-        # These appear as headers in the Gallup PDFs
-        header_pattern = r"(\d+)\.\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s*®?"
-
-        matches = list(re.finditer(header_pattern, text))
-
-        for i, match in enumerate(matches):
-            rank = match.group(1)
-            name = match.group(2)
-            start = match.end()
-
-            # End is either the next match or end of text
-            if i + 1 < len(matches):
-                end = matches[i + 1].start()
-            else:
-                end = len(text)
-
-            section_text = text[start:end]
-            key = f"{rank}. {name}"
+        # These appear as headers in the Gallup PDFs; each section runs to the
+        # next header, the last one to the end of the text
+        matches = headers if headers is not None else _find_strength_headers(text)
+        ends = [match.start() for match in matches[1:]] + [len(text)]
 
+        for match, end in zip(matches, ends):
+            section_text = text[match.end() : end]
             # Only store if this section has meaningful content
             if "HOW YOU CAN THRIVE" in section_text or "WHY YOU SUCCEED" in section_text:
-                sections[key] = section_text
+                sections[f"{match.group(1)}. {match.group(2)}"] = section_text
 
         return sections
 
     def _extract_strength_insight(self, section: str, insight: StrengthInsight) -> None:
         """Extract insight details from a strength section."""
         # Extract description (after "HOW YOU CAN THRIVE")
-        desc_match = re.search(
-            r"HOW YOU CAN THRIVE\s*(.*?)(?:WHY YOUR|$)",
-            section,
-            re.DOTALL | re.IGNORECASE,
-        )
+        desc_match = _DESCRIPTION_RE.search(section)
         if desc_match:
             insight.description = self._clean_text(desc_match.group(1))
 
         # Extract "WHY YOU SUCCEED" section
-        succeed_match = re.search(
-            r"WHY YOU SUCCEED.*?\n\s*(.*?)(?:TAKE ACTION|$)",
-            section,
-            re.DOTALL | re.IGNORECASE,
-        )
+        succeed_match = _WHY_SUCCEED_RE.search(section)
         if succeed_match:
             insight.why_succeed = self._clean_text(succeed_match.group(1))
 
         # Extract action items (bullet points after TAKE ACTION)
-        action_match = re.search(
-            r"TAKE ACTION.*?\n(.*?)(?:WATCH OUT|$)",
-            section,
-            re.DOTALL | re.IGNORECASE,
-        )
+        action_match = _TAKE_ACTION_RE.search(section)
         if action_match:
-            items = re.findall(r"[•●]\s*(.+?)(?=[•●]|$)", action_match.group(1), re.DOTALL)
-            insight.action_items = [self._clean_text(item) for item in items if item.strip()]
+            insight.action_items = self._split_bullets(action_match.group(1))
 
         # Extract blind spots
-        blind_match = re.search(
-            r"WATCH OUT FOR BLIND SPOTS\s*(.*?)(?=\d+\.\s+[A-Z]|StrengthsFinder|$)",
-            section,
-            re.DOTALL | re.IGNORECASE,
-        )
+        blind_match = _BLIND_SPOTS_RE.search(section)
         if blind_match:
-            items = re.findall(r"[•●]\s*(.+?)(?=[•●]|$)", blind_match.group(1), re.DOTALL)
-            insight.blind_spots = [self._clean_text(item) for item in items if item.strip()]
+            insight.blind_spots = self._split_bullets(blind_match.group(1))
+
+    def _split_bullets(self, text: str) -> list[str]:
+        """Split a bulleted block into cleaned items, dropping text before the first bullet."""
+        items = text.translate(_BULLET_TRANSLATION).split("•")[1:]
+        return [cleaned for item in items if (cleaned := self._clean_text(item))]
 
     def _clean_text(self, text: str) -> str:
-        """Clean extracted text by removing extra whitespace."""
-        text = re.sub(r"\s+", " ", text)
-        text = self._clean_copyright(text)
-        text = re.sub(r"\d+\s*$", "", text)
-        return text.strip()
+        """Clean extracted text by removing copyright notices and extra whitespace."""
+        return self._collapse_text(_COPYRIGHT_RE.sub(" ", text).replace("®", ""))
+
+    def _collapse_text(self, text: str) -> str:
+        """Collapse whitespace and drop a trailing page number.
+
+        Enough on its own for text cut from a section that already went
+        through _clean_copyright.
+        """
+        return " ".join(text.split()).rstrip("0123456789").rstrip()
 
     def _build_sections(self, data: CliftonStrengthsData) -> list[Section]:
         """Build labeled sections from parsed CliftonStrengths data."""
@@ -729,18 +870,17 @@ class CliftonStrengthsGatherer:
                 "| Rank | Strength | Domain |",
                 "|------|----------|--------|",
             ]
+            # Table rows and domain distribution in one pass
+            domain_groups: dict[str, list[str]] = {}
             for insight in data.top_5:
                 lines.append(
                     f"| {insight.rank} | **{insight.name}** | {insight.domain} |"
                 )
+                domain_groups.setdefault(insight.domain, []).append(insight.name)
             lines.append("")
 
-            # Domain distribution
-            domain_counts: dict[str, list[str]] = {}
-            for insight in data.top_5:
-                domain_counts.setdefault(insight.domain, []).append(insight.name)
             lines.append("### Domain Distribution (Top 5)")
-            for domain, strengths in domain_counts.items():
+            for domain, strengths in domain_groups.items():
                 lines.append(f"- **{domain}:** {', '.join(strengths)}")
 
             sections.append(Section("Top 5 Signature Themes", "\n".join(lines)))
@@ -756,12 +896,10 @@ class CliftonStrengthsGatherer:
                     lines.append(f"**Why You Succeed:** {insight.why_succeed}")
                 if insight.action_items:
                     lines.append("**Action Items:**")
-                    for item in insight.action_items[:3]:
-                        lines.append(f"- {item}")
+                    lines.extend(f"- {item}" for item in insight.action_items[:3])
                 if insight.blind_spots:
                     lines.append("**Blind Spots to Watch:**")
-                    for item in insight.blind_spots[:2]:
-                        lines.append(f"- {item}")
+                    lines.extend(f"- {item}" for item in insight.blind_spots[:2])
                 lines.append("")
             sections.append(Section("Detailed Strength Insights", "\n".join(lines).rstrip()))
 
@@ -778,8 +916,7 @@ class CliftonStrengthsGatherer:
                     lines.append(
                         f"### {insight.rank}. {insight.name} -- What Makes You Stand Out"
                     )
-                    for paragraph in insight.unique_insights:
-                        lines.append(paragraph)
+                    lines.extend(insight.unique_insights)
             sections.append(Section("Personalized Talent Patterns", "\n\n".join(lines)))
 
         # Extended Ideas for Action
@@ -789,8 +926,9 @@ class CliftonStrengthsGatherer:
             for insight in all_strengths:
                 if len(insight.action_items) > 3:
                     lines.append(f"### {insight.rank}. {insight.name}")
-                    for i, item in enumerate(insight.action_items, 1):
-                        lines.append(f"{i}. {item}")
+                    lines.extend(
+                        f"{i}. {item}" for i, item in enumerate(insight.action_items, 1)
+                    )
                     lines.append("")
             sections.append(
                 Section("Extended Ideas for Action", "\n".join(lines).rstrip())
@@ -806,8 +944,7 @@ class CliftonStrengthsGatherer:
             for insight in all_strengths:
                 if insight.sounds_like_quotes:
                     lines.append(f"### {insight.rank}. {insight.name}")
-                    for quote in insight.sounds_like_quotes:
-                        lines.append(f"> {quote}")
+                    lines.extend(f"> {quote}" for quote in insight.sounds_like_quotes)
             sections.append(Section("Strengths in Practice", "\n\n".join(lines)))
 
         # Top 10 (6-10 only)
@@ -816,8 +953,10 @@ class CliftonStrengthsGatherer:
                 "| Rank | Strength | Domain |",
                 "|------|----------|--------|",
             ]
-            for insight in data.top_10[5:]:
-                lines.append(f"| {insight.rank} | {insight.name} | {insight.domain} |")
+            lines.extend(
+                f"| {insight.rank} | {insight.name} | {insight.domain} |"
+                for insight in data.top_10[5:]
+            )
             sections.append(Section("Supporting Strengths (6-10)", "\n".join(lines)))
 
         # Full 34 ranking
@@ -5,6 +5,7 @@ Also provides helpers to reduce code duplication when gathering from
 multiple MCP sources.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -33,9 +34,12 @@ class MarketGatherer(ABC):
     cache_ttl_hours: int = 24
 
     def __init__(self) -> None:
-        """Initialize gatherer with cache directory."""
+        """Initialize gatherer with cache directory.
+
+        The directory is created on first write, not here; a missing cache
+        file already reads as a miss.
+        """
         self._cache_dir = settings.market_cache_dir
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
 
     @abstractmethod
     async def gather(self, **kwargs: Any) -> dict[str, Any]:
@@ -74,46 +78,29 @@ class MarketGatherer(ABC):
         key_hash = hashlib.md5(cache_key.encode(), usedforsecurity=False).hexdigest()[:16]
         return self._cache_dir / f"{self.__class__.__name__}_{key_hash}.json"
 
-    def _is_cache_valid(self, cache_path: Path) -> bool:
-        """Check if cache file exists and is not expired.
+    def _read_valid_cache(self, cache_path: Path) -> dict[str, Any] | None:
+        """Read cached data if the cache file exists and has not expired.
+
+        The file is opened and parsed once for both the TTL check and the
+        payload.
 
         Args:
             cache_path: Path to cache file
 
         Returns:
-            True if cache is valid and can be used
+            Cached data, or None if missing, expired or invalid
         """
-        if not cache_path.exists():
-            return False
-
         try:
             with open(cache_path) as f:
                 cache_data = json.load(f)
-
             cached_at = datetime.fromisoformat(cache_data.get("cached_at", ""))
-            ttl_hours = self.cache_ttl_hours
-            expires_at = cached_at + timedelta(hours=ttl_hours)
-
-            return datetime.now() < expires_at
-
-        except (json.JSONDecodeError, ValueError, KeyError):
-            return False
-
-    def _read_cache(self, cache_path: Path) -> dict[str, Any] | None:
-        """Read data from cache file.
-
-        Args:
-            cache_path: Path to cache file
+        except (OSError, json.JSONDecodeError, ValueError, AttributeError):
+            return None
 
-        Returns:
-            Cached data or None if invalid
-        """
-        try:
-            with open(cache_path) as f:
-                cache_data = json.load(f)
-            return cache_data.get("data")
-        except (json.JSONDecodeError, OSError):
+        expires_at = cached_at + timedelta(hours=self.cache_ttl_hours)
+        if datetime.now() >= expires_at:
             return None
+        return cache_data.get("data")
 
     def _write_cache(self, cache_path: Path, data: dict[str, Any]) -> None:
         """Write data to cache file.
@@ -128,6 +115,8 @@ class MarketGatherer(ABC):
             "data": data,
         }
         try:
+            # Created lazily here, which also covers /reset removing the tree
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
             with open(cache_path, "w") as f:
                 json.dump(cache_data, f, indent=2, default=str)
         except OSError as e:
@@ -150,9 +139,9 @@ class MarketGatherer(ABC):
         cache_key = self._get_cache_key(**kwargs)
         cache_path = self._get_cache_path(cache_key)
 
-        # Check cache unless refresh requested
-        if not refresh and self._is_cache_valid(cache_path):
-            cached_data = self._read_cache(cache_path)
+        # Check cache unless refresh requested (file I/O off the event loop)
+        if not refresh:
+            cached_data = await asyncio.to_thread(self._read_valid_cache, cache_path)
             if cached_data is not None:
                 logger.info(f"Using cached data for {self.__class__.__name__}")
                 return cached_data
@@ -162,7 +151,7 @@ class MarketGatherer(ABC):
         data = await self.gather(**kwargs)
 
         # Cache the results
-        self._write_cache(cache_path, data)
+        await asyncio.to_thread(self._write_cache, cache_path, data)
 
         return data
 
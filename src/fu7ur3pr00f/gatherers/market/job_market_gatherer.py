@@ -16,6 +16,7 @@ Sources:
 - Tavily: Salary research via web search
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -76,22 +77,38 @@ class JobMarketGatherer(MarketGatherer):
 
         logger.info(f"Gathering job market data for '{role}' in '{location}'")
 
-        # Iterate over configured sources (OCP: no modification needed to add sources)
-        for source_config in JOB_SOURCE_REGISTRY:
-            if not source_config.enabled:
-                continue
-
-            # Build tool args using source-specific builder
-            tool_args = source_config.build_tool_args(role, location, limit)
-
-            jobs = await self._gather_from_source(
+        # Query every enabled source concurrently (OCP: no modification needed
+        # to add sources). _gather_from_source never raises, so one failing
+        # board cannot cancel the others.
+        sources = [c for c in JOB_SOURCE_REGISTRY if c.enabled]
+        pending = [
+            self._gather_from_source(
                 source_name=source_config.source_name,
                 tool_name=source_config.tool_name,
-                tool_args=tool_args,
+                tool_args=source_config.build_tool_args(role, location, limit),
                 results=results,
                 source_label=source_config.source_label,
             )
+            for source_config in sources
+        ]
+
+        # Salary search runs alongside (special handling for different response format)
+        if include_salary:
+            pending.append(
+                self._gather_from_source(
+                    source_name=SALARY_SOURCE.source_name,
+                    tool_name=SALARY_SOURCE.tool_name,
+                    tool_args=SALARY_SOURCE.build_tool_args(role, location, limit),
+                    results=results,
+                    extractor=lambda p: p.get("results", []),
+                    source_label=SALARY_SOURCE.source_label,
+                )
+            )
 
+        gathered = await asyncio.gather(*pending)
+
+        # Merge in registry order so output is stable regardless of finish order
+        for source_config, jobs in zip(sources, gathered):
             if jobs:
                 # Apply post-processor if defined
                 if source_config.post_process:
@@ -109,19 +126,7 @@ class JobMarketGatherer(MarketGatherer):
             if "remote" in str(j.get("location", "")).lower() or j.get("is_remote", False)
         )
 
-        # Gather salary data (special handling for different response format)
-        if include_salary:
-            salary_args = SALARY_SOURCE.build_tool_args(role, location, limit)
-            salary_results = await self._gather_from_source(
-                source_name=SALARY_SOURCE.source_name,
-                tool_name=SALARY_SOURCE.tool_name,
-                tool_args=salary_args,
-                results=results,
-                extractor=lambda p: p.get("results", []),
-                source_label=SALARY_SOURCE.source_label,
-            )
-            if salary_results:
-                results["salary_data"] = salary_results
+        if include_salary and gathered[-1]:
+            results["salary_data"] = gathered[-1]
 
         return results
-
@@ -18,6 +18,7 @@ import atexit
 import contextlib
 import logging
 import threading
+from collections.abc import Coroutine
 from typing import Any
 
 from .base import MCPClient, MCPClientError, MCPConnectionError, MCPToolResult
@@ -94,6 +95,28 @@ def _get_loop() -> asyncio.AbstractEventLoop:
     return _loop
 
 
+def run_coroutine(coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+    """Run a coroutine on the pool's event loop and wait for its result.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Max seconds to wait for result (None waits indefinitely)
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        RuntimeError: If called from the pool's own loop thread, where
+            waiting for the result would deadlock
+    """
+    with _lock:
+        loop = _get_loop()
+    if threading.current_thread() is _thread:
+        coro.close()
+        raise RuntimeError("Cannot block on the MCP pool loop from its own thread")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=timeout)
+
+
 async def _get_or_connect(server_type: MCPServerType) -> MCPClient:
     """Get cached client or create and connect a new one."""
     client = _clients.get(server_type)
@@ -152,12 +175,7 @@ def call_tool(
     Raises:
         MCPClientError: On connection or tool failure
     """
-    with _lock:
-        loop = _get_loop()
-    future = asyncio.run_coroutine_threadsafe(
-        _call(server_type, tool_name, args), loop,
-    )
-    return future.result(timeout=timeout)
+    return run_coroutine(_call(server_type, tool_name, args), timeout=timeout)
 
 
 async def _shutdown_async() -> None:
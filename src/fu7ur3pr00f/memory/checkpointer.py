@@ -18,17 +18,45 @@ Usage:
 """
 
 import threading
+from functools import lru_cache
 from pathlib import Path
 
 from langgraph.checkpoint.sqlite import SqliteSaver
 
+# Distinct thread IDs via a loose index scan: each step seeks the next
+# thread_id in the (thread_id, ...) primary key instead of scanning every
+# checkpoint row, so cost scales with thread count, not history size.
+_LIST_THREADS_SQL = """
+WITH RECURSIVE
+  cp(id) AS (
+    SELECT MIN(thread_id) FROM checkpoints
+    UNION ALL
+    SELECT (SELECT MIN(thread_id) FROM checkpoints WHERE thread_id > cp.id)
+    FROM cp WHERE cp.id IS NOT NULL
+  ),
+  wr(id) AS (
+    SELECT MIN(thread_id) FROM writes
+    UNION ALL
+    SELECT (SELECT MIN(thread_id) FROM writes WHERE thread_id > wr.id)
+    FROM wr WHERE wr.id IS NOT NULL
+  )
+SELECT id FROM cp WHERE id IS NOT NULL
+UNION
+SELECT id FROM wr WHERE id IS NOT NULL
+"""
+
 # Cached singleton to avoid creating new connections on every call
 _checkpointer: SqliteSaver | None = None
 _cp_lock = threading.Lock()
 
 
+@lru_cache(maxsize=1)
 def get_data_dir() -> Path:
-    """Get or create the FutureProof data directory."""
+    """Get or create the FutureProof data directory.
+
+    Resolved and created once per process; callers hit this on every
+    profile load, history lookup and checkpointer access.
+    """
     from fu7ur3pr00f.utils.security import secure_mkdir
 
     data_dir = Path.home() / ".fu7ur3pr00f"
@@ -60,6 +88,11 @@ def get_checkpointer() -> SqliteSaver:
         # Create connection with check_same_thread=False for multi-threaded use
         conn = sqlite3.connect(str(db_path), check_same_thread=False)
         db_path.chmod(0o600)
+        # WAL lets readers proceed during writes. NORMAL sync keeps the database
+        # from corrupting under WAL, but commits made just before a power loss
+        # or OS crash can roll back, so recent chat history is not guaranteed
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         _checkpointer = SqliteSaver(conn)
         return _checkpointer
 
@@ -73,21 +106,16 @@ def clear_thread_history(thread_id: str) -> None:
     Note:
         This is a destructive operation. Use with caution.
     """
-    import sqlite3
-
     db_path = get_data_dir() / "memory.db"
     if not db_path.exists():
         return
 
-    conn = sqlite3.connect(str(db_path))
-    try:
-        cursor = conn.cursor()
+    # Reuse the checkpointer's long-lived connection instead of reopening the DB
+    saver = get_checkpointer()
+    with saver.lock, saver.conn:
         # LangGraph stores data across both tables with thread_id
-        cursor.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
-        cursor.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
-        conn.commit()
-    finally:
-        conn.close()
+        saver.conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+        saver.conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
 
 
 def list_threads() -> list[str]:
@@ -102,16 +130,11 @@ def list_threads() -> list[str]:
     if not db_path.exists():
         return []
 
-    conn = sqlite3.connect(str(db_path))
+    saver = get_checkpointer()
     try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT DISTINCT thread_id FROM checkpoints "
-            "UNION SELECT DISTINCT thread_id FROM writes"
-        )
-        return [row[0] for row in cursor.fetchall()]
+        with saver.lock:
+            cursor = saver.conn.execute(_LIST_THREADS_SQL)
+            return [row[0] for row in cursor.fetchall()]
     except sqlite3.OperationalError:
         # Table doesn't exist yet
         return []
-    finally:
-        conn.close()
@@ -87,6 +87,19 @@ class EpisodicStore(ChromaDBStore):
         logger.info("Stored memory: %s (%s)", memory.id, memory.memory_type.value)
         return memory.id
 
+    def remember_many(self, memories: list[EpisodicMemory]) -> list[str]:
+        """Store several episodic memories with a single collection add."""
+        if not memories:
+            return []
+        ids = [m.id for m in memories]
+        self._add(
+            ids=ids,
+            documents=[m.content for m in memories],
+            metadatas=[m.to_metadata() for m in memories],
+        )
+        logger.info("Stored %d memories", len(ids))
+        return ids
+
     def recall(
         self,
         query: str,
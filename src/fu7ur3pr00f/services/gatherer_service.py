@@ -149,14 +149,9 @@ class GathererService:
                 results["linkedin"] = False
 
             # Auto-detect CliftonStrengths PDFs
-            from ..gatherers.cliftonstrengths import GALLUP_PDF_INDICATORS
-
-            gallup_pdfs = [
-                p
-                for p in raw_dir.glob("*.pdf")
-                if any(ind in p.name.lower() for ind in GALLUP_PDF_INDICATORS)
-            ]
-            if gallup_pdfs:
+            from ..gatherers.cliftonstrengths import find_gallup_pdfs
+
+            if find_gallup_pdfs(raw_dir):
                 results["assessment"] = _timed_gather(
                     "assessment", self.gather_assessment, raw_dir, verbose=verbose
                 )
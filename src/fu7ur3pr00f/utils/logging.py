@@ -1,12 +1,28 @@
 """Centralized logging configuration for FutureProof."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Literal
 
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+_file_listener: QueueListener | None = None
+
+
+def _stop_file_listener() -> None:
+    """Flush and stop the background file-logging thread, if running."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def setup_logging(
     level: LogLevel = "INFO",
@@ -23,11 +39,13 @@ def setup_logging(
     Returns:
         Configured root logger instance
     """
+    global _file_listener
     logger = logging.getLogger("fu7ur3pr00f")
     logger.setLevel(getattr(logging, level))
 
     # Clear existing handlers
     logger.handlers.clear()
+    _stop_file_listener()
 
     # Console handler - only warnings and above to keep CLI output clean
     console_handler = logging.StreamHandler(sys.stderr)
@@ -36,16 +54,23 @@ def setup_logging(
     console_handler.setFormatter(console_format)
     logger.addHandler(console_handler)
 
-    # File handler if specified
+    # File handler if specified. Records are handed to a queue and written
+    # by a listener thread so DEBUG logging never blocks the caller on disk I/O.
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
         file_format = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
         log_file.chmod(0o600)
 
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
+        _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _file_listener.start()
+
     return logger
 
 
@@ -130,10 +130,9 @@ def secure_mkdir(path: str | Path, *, mode: int = 0o700) -> Path:
     Returns:
         The directory path.
     """
-    p = Path(path)
-    p.mkdir(parents=True, exist_ok=True)
-    p.chmod(mode)
-    return p
+    os.makedirs(path, mode=mode, exist_ok=True)
+    os.chmod(path, mode)
+    return Path(path)
 
 
 def sanitize_for_prompt(text: str) -> str:
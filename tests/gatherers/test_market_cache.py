@@ -0,0 +1,84 @@
+"""Tests for MarketGatherer TTL caching."""
+
+import asyncio
+import json
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from fu7ur3pr00f.gatherers.market.base import MarketGatherer
+
+
+class _FakeGatherer(MarketGatherer):
+    """Minimal gatherer that counts fresh gathers."""
+
+    cache_ttl_hours = 1
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+        self.calls = 0
+
+    async def gather(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        return {"value": self.calls}
+
+    def _get_cache_key(self, **kwargs: Any) -> str:
+        return "fake"
+
+
+def _write(path: Path, cached_at: datetime, data: dict[str, Any]) -> None:
+    path.write_text(json.dumps({"cached_at": cached_at.isoformat(), "data": data}))
+
+
+class TestReadValidCache:
+    """Test single-pass cache validation and read."""
+
+    @pytest.fixture
+    def gatherer(self, tmp_path: Path) -> _FakeGatherer:
+        return _FakeGatherer(tmp_path)
+
+    def test_missing_file(self, gatherer: _FakeGatherer, tmp_path: Path) -> None:
+        assert gatherer._read_valid_cache(tmp_path / "none.json") is None
+
+    def test_fresh_entry(self, gatherer: _FakeGatherer, tmp_path: Path) -> None:
+        path = tmp_path / "c.json"
+        _write(path, datetime.now(), {"a": 1})
+        assert gatherer._read_valid_cache(path) == {"a": 1}
+
+    def test_expired_entry(self, gatherer: _FakeGatherer, tmp_path: Path) -> None:
+        path = tmp_path / "c.json"
+        _write(path, datetime.now() - timedelta(hours=2), {"a": 1})
+        assert gatherer._read_valid_cache(path) is None
+
+    def test_corrupt_file(self, gatherer: _FakeGatherer, tmp_path: Path) -> None:
+        path = tmp_path / "c.json"
+        path.write_text("not json")
+        assert gatherer._read_valid_cache(path) is None
+
+
+class TestGatherWithCache:
+    """Test gather_with_cache round trip."""
+
+    def test_second_call_uses_cache(self, tmp_path: Path) -> None:
+        gatherer = _FakeGatherer(tmp_path)
+        first = asyncio.run(gatherer.gather_with_cache())
+        second = asyncio.run(gatherer.gather_with_cache())
+        assert first == second == {"value": 1}
+        assert gatherer.calls == 1
+
+    def test_refresh_bypasses_cache(self, tmp_path: Path) -> None:
+        gatherer = _FakeGatherer(tmp_path)
+        asyncio.run(gatherer.gather_with_cache())
+        refreshed = asyncio.run(gatherer.gather_with_cache(refresh=True))
+        assert refreshed == {"value": 2}
+
+    def test_write_recreates_removed_cache_dir(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache" / "market"
+        cache_dir.mkdir(parents=True)
+        gatherer = _FakeGatherer(cache_dir)
+        shutil.rmtree(tmp_path / "cache")
+        asyncio.run(gatherer.gather_with_cache())
+        assert gatherer._get_cache_path("fake").exists()
@@ -0,0 +1,33 @@
+"""Tests for the gatherers package namespace."""
+
+import pytest
+
+
+class TestLazyGatherers:
+    """Test gatherers are imported on first attribute access."""
+
+    def test_market_import_skips_profile_gatherers(self) -> None:
+        """Test loading gatherers.market leaves the profile gatherers unimported."""
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, fu7ur3pr00f.gatherers.market; "
+            "sys.exit('fu7ur3pr00f.gatherers.linkedin' in sys.modules)"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run([sys.executable, "-c", code], env=env, check=False)
+        assert result.returncode == 0
+
+    def test_attribute_resolves_class(self) -> None:
+        from fu7ur3pr00f import gatherers
+        from fu7ur3pr00f.gatherers.cv import CVGatherer
+
+        assert gatherers.CVGatherer is CVGatherer
+
+    def test_unknown_attribute_raises(self) -> None:
+        from fu7ur3pr00f import gatherers
+
+        with pytest.raises(AttributeError):
+            _ = gatherers.NotAGatherer  # type: ignore[attr-defined]
@@ -33,3 +33,14 @@ class TestCLIBasics:
         result = runner.invoke(app, ["--help"])
         assert result.exit_code == 0
         assert "--debug" in result.output
+
+    def test_import_does_not_load_settings(self) -> None:
+        """Test importing the CLI defers pydantic-settings until a command runs."""
+        import os
+        import subprocess
+        import sys
+
+        code = "import sys, fu7ur3pr00f.cli; sys.exit('pydantic_settings' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run([sys.executable, "-c", code], env=env, check=False)
+        assert result.returncode == 0
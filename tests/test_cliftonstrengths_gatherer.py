@@ -0,0 +1,358 @@
+"""Tests for CliftonStrengthsGatherer — Gallup PDF report parsing."""
+
+import re
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fu7ur3pr00f.gatherers.cliftonstrengths import (
+    CliftonStrengthsData,
+    CliftonStrengthsGatherer,
+    StrengthInsight,
+    _trie_pattern,
+    find_gallup_pdfs,
+)
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+TOP_5_TEXT = """
+Jane Quinn Doe | 03-14-2023
+   1. Learner
+   2. Strategic
+   3. Achiever
+   4. Woo
+   5. Empathy
+
+1. Learner ®
+HOW YOU CAN THRIVE
+You love to learn and the process of learning energizes you.
+WHY YOUR LEARNER THEME MATTERS
+WHY YOU SUCCEED WITH LEARNER
+  You thrive in dynamic work environments.
+TAKE ACTION
+• Seek roles that require some form of technical competence.
+• Track the progress of your learning. 7
+WATCH OUT FOR BLIND SPOTS
+• You might value learning over performance.
+
+12
+StrengthsFinder® and the 34 theme names are trademarks of Gallup. All rights reserved.
+2. Strategic ®
+HOW YOU CAN THRIVE
+You sort through the clutter and find the best route.
+WHY YOUR STRATEGIC THEME MATTERS
+WHY YOU SUCCEED WITH STRATEGIC
+  You see patterns where others see complexity.
+TAKE ACTION
+● Take time to fully reflect about a goal.
+"""
+
+TOP_10_TEXT = TOP_5_TEXT.replace(
+    "   5. Empathy\n",
+    "   5. Empathy\n   6. Focus\n   7. Input\n   8. Arranger\n   9. Relator\n   10. Ideation\n",
+)
+
+ACTION_PLANNING_TEXT = """
+   1. Learner
+   2. Strategic
+Section I: Awareness
+Learner
+YOUR PERSONALIZED STRENGTHS INSIGHTS
+What makes you stand out?
+Chances are good that you are eager to learn new things every single day.
+By nature, you gravitate toward experiences that stretch your knowledge.
+QUESTIONS
+Section II: Application
+Learner
+IDEAS FOR ACTION
+Refine how you learn by teaching others what you have just picked up.
+
+Seek roles that require you to stay current with a fast-changing field.
+
+QUESTIONS
+Section III: Achievement
+LEARNER SOUNDS LIKE THIS:
+
+Kim S., engineer: I am always reading something new, it keeps me going every day.
+"""
+
+
+def _gather(tmp_path: Path, texts: dict[str, str]):
+    """Run gather() over fake PDFs whose extracted text is given by filename."""
+    for name in texts:
+        (tmp_path / name).write_bytes(b"%PDF-1.4 fake")
+    gatherer = CliftonStrengthsGatherer()
+    with patch.object(
+        CliftonStrengthsGatherer,
+        "_extract_text",
+        side_effect=lambda path: texts[path.name],
+    ):
+        return gatherer.gather(tmp_path)
+
+
+# ---------------------------------------------------------------------------
+# File detection
+# ---------------------------------------------------------------------------
+
+
+class TestReportDetection:
+    def test_find_gallup_pdfs(self, tmp_path):
+        for name in ("Jane_SF_TOP_5.pdf", "CliftonStrengths-report.pdf", "resume.pdf"):
+            (tmp_path / name).write_bytes(b"%PDF-1.4 fake")
+        (tmp_path / "gallup_notes.txt").write_text("notes")
+        (tmp_path / "old_top_5.pdf").mkdir()
+
+        found = sorted(p.name for p in find_gallup_pdfs(tmp_path))
+        assert found == ["CliftonStrengths-report.pdf", "Jane_SF_TOP_5.pdf"]
+
+    def test_find_gallup_pdfs_missing_dir(self, tmp_path):
+        assert find_gallup_pdfs(tmp_path / "missing") == []
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("JANE_ALL_34.PDF", "all_34"),
+            ("JANE_SF_TOP_5.PDF", "top_5"),
+            ("JANE_ACTION_PLANNING_TOP_10.PDF", "action_planning"),
+            ("JANE_LEADERSHIP_INSIGHT_TOP_10.PDF", "leadership"),
+            ("JANE_DISCOVERY_DEVELOPMENT.PDF", "discovery"),
+            ("JANE_TOP_10.PDF", "top_10"),
+            ("JANE.PDF", "unknown"),
+        ],
+    )
+    def test_get_report_type(self, filename, expected):
+        assert CliftonStrengthsGatherer()._get_report_type(filename) == expected
+
+
+class TestExtractText:
+    def test_decodes_utf8_output(self, tmp_path):
+        mock_result = MagicMock(returncode=0, stdout="1. Learner ®\n".encode())
+        with (
+            patch("shutil.which", return_value="/usr/bin/pdftotext"),
+            patch("subprocess.run", return_value=mock_result) as run,
+        ):
+            text = CliftonStrengthsGatherer()._extract_text(tmp_path / "SF_TOP_5.pdf")
+
+        assert text == "1. Learner ®\n"
+        assert run.call_args.args[0][1:4] == ["-layout", "-enc", "UTF-8"]
+
+    def test_failure_returns_empty(self, tmp_path):
+        mock_result = MagicMock(returncode=1, stdout=b"", stderr=b"Syntax Error")
+        with (
+            patch("shutil.which", return_value="/usr/bin/pdftotext"),
+            patch("subprocess.run", return_value=mock_result),
+        ):
+            assert CliftonStrengthsGatherer()._extract_text(tmp_path / "SF_TOP_5.pdf") == ""
+
+    def test_missing_pdftotext_returns_empty(self, tmp_path):
+        with patch("shutil.which", return_value=None):
+            assert CliftonStrengthsGatherer()._extract_text(tmp_path / "SF_TOP_5.pdf") == ""
+
+
+# ---------------------------------------------------------------------------
+# Text parsing
+# ---------------------------------------------------------------------------
+
+
+class TestExtractRankedStrengths:
+    def test_filters_unknown_names_and_respects_max_rank(self):
+        text = "1. Learner\n2. Nonsense\n2. Woo\n3. Focus\n2. Empathy"
+        result = CliftonStrengthsGatherer()._extract_ranked_strengths(text, max_rank=2)
+        assert [(s.rank, s.name, s.domain) for s in result] == [
+            (1, "Learner", "STRATEGIC THINKING"),
+            (2, "Woo", "INFLUENCING"),
+        ]
+
+    def test_hyphenated_name(self):
+        result = CliftonStrengthsGatherer()._extract_ranked_strengths("7. Self-Assurance")
+        assert result[0].name == "Self-Assurance"
+
+    def test_stops_once_every_rank_is_filled(self):
+        text = "0. Focus\n1. Woo\n1. Learner Woo details"
+        result = CliftonStrengthsGatherer()._extract_ranked_strengths(text, max_rank=1)
+        assert [(s.rank, s.name) for s in result] == [(1, "Woo")]
+
+    def test_long_numbers_are_not_truncated_to_a_rank(self):
+        assert CliftonStrengthsGatherer()._extract_ranked_strengths("2023. Learner") == []
+
+
+class TestTriePattern:
+    def test_matches_exactly_the_words(self):
+        words = ["Achiever", "Activator", "Arranger", "Woo", "Wood"]
+        pattern = re.compile(rf"(?:{_trie_pattern(words)})\Z")
+        assert _trie_pattern(["Achiever", "Activator"]) == "Ac(?:hiever|tivator)"
+        assert all(pattern.match(word) for word in words)
+        assert not any(pattern.match(word) for word in ("Ach", "Wo", "Woods", "Belief"))
+
+
+class TestCleanText:
+    def test_collapses_whitespace_and_trailing_page_number(self):
+        assert CliftonStrengthsGatherer()._clean_text("  Keep\n learning   daily. 12 ") == (
+            "Keep learning daily."
+        )
+
+    def test_strips_copyright_and_registered_mark(self):
+        text = "Use Learner® daily. StrengthsFinder® is a Gallup mark. All rights reserved. Go"
+        assert CliftonStrengthsGatherer()._clean_text(text) == "Use Learner daily. Go"
+
+    def test_removed_mark_leaves_single_space(self):
+        assert CliftonStrengthsGatherer()._clean_text("Learner ® is 4\n") == "Learner is"
+
+
+class TestSplitBullets:
+    def test_mixed_bullet_glyphs(self):
+        text = "intro\n • Read daily. 7\n● Teach others.\n"
+        assert CliftonStrengthsGatherer()._split_bullets(text) == ["Read daily.", "Teach others."]
+
+    def test_bullet_operator_and_zero_width_space(self):
+        text = "∙ Keep\u200b notes.\n∙ Share them."
+        assert CliftonStrengthsGatherer()._split_bullets(text) == ["Keep notes.", "Share them."]
+
+    def test_empty_bullet_is_skipped(self):
+        assert CliftonStrengthsGatherer()._split_bullets("• \n● Plan ahead.") == ["Plan ahead."]
+
+    def test_bullet_with_only_a_page_number_is_skipped(self):
+        assert CliftonStrengthsGatherer()._split_bullets("• Plan ahead.\n• 12\n") == ["Plan ahead."]
+
+
+class TestStrengthDetails:
+    def test_extracts_sections_for_top_5(self):
+        gatherer = CliftonStrengthsGatherer()
+        data = CliftonStrengthsData()
+        gatherer._parse_top_5(TOP_5_TEXT, data)
+        assert gatherer._parse_strength_details(TOP_5_TEXT, data) is True
+
+        learner = data.top_5[0]
+        assert learner.description == (
+            "You love to learn and the process of learning energizes you."
+        )
+        assert learner.why_succeed == "You thrive in dynamic work environments."
+        assert learner.action_items == [
+            "Seek roles that require some form of technical competence.",
+            "Track the progress of your learning.",
+        ]
+        assert learner.blind_spots == ["You might value learning over performance."]
+        assert data.top_5[1].action_items == ["Take time to fully reflect about a goal."]
+
+    def test_section_with_different_rank_matched_by_name(self):
+        gatherer = CliftonStrengthsGatherer()
+        data = CliftonStrengthsData()
+        gatherer._parse_top_5("1. Learner\n2. Woo", data)
+        text = "7. Learner ®\nHOW YOU CAN THRIVE\nKeep learning.\nWHY YOUR LEARNER THEME"
+        assert gatherer._parse_strength_details(text, data) is True
+        assert data.top_5[0].description == "Keep learning."
+
+    def test_no_detail_sections(self):
+        gatherer = CliftonStrengthsGatherer()
+        data = CliftonStrengthsData()
+        gatherer._parse_top_5("1. Learner\n2. Woo", data)
+        assert gatherer._parse_strength_details("1. Learner\n2. Woo", data) is False
+
+    def test_action_planning_sections(self):
+        gatherer = CliftonStrengthsGatherer()
+        data = CliftonStrengthsData()
+        gatherer._parse_action_planning(ACTION_PLANNING_TEXT, data)
+
+        learner = data.top_10[0]
+        assert learner.unique_insights == [
+            "Chances are good that you are eager to learn new things every single day.",
+            "By nature, you gravitate toward experiences that stretch your knowledge.",
+        ]
+        assert learner.action_items == [
+            "Refine how you learn by teaching others what you have just picked up.",
+            "Seek roles that require you to stay current with a fast-changing field.",
+        ]
+        assert learner.sounds_like_quotes == [
+            "Kim S., engineer: I am always reading something new, it keeps me going every day."
+        ]
+
+
+# ---------------------------------------------------------------------------
+# gather()
+# ---------------------------------------------------------------------------
+
+
+class TestGather:
+    def test_no_gallup_pdfs_raises(self, tmp_path):
+        (tmp_path / "resume.pdf").write_bytes(b"%PDF-1.4 fake")
+        with pytest.raises(FileNotFoundError):
+            CliftonStrengthsGatherer().gather(tmp_path)
+
+    def test_top_5_report(self, tmp_path):
+        sections = _gather(tmp_path, {"Jane_SF_TOP_5.pdf": TOP_5_TEXT})
+        by_name = {s.name: s.content for s in sections}
+
+        assert by_name["CliftonStrengths Assessment"] == (
+            "**Name:** Jane Quinn Doe\n"
+            "**Assessment Date:** 03-14-2023\n"
+            "**Dominant Domain:** STRATEGIC THINKING"
+        )
+        assert "| 1 | **Learner** | STRATEGIC THINKING |" in by_name["Top 5 Signature Themes"]
+        assert "### 1. Learner (STRATEGIC THINKING)" in by_name["Detailed Strength Insights"]
+
+    def test_multiple_reports_are_merged(self, tmp_path):
+        sections = _gather(
+            tmp_path,
+            {
+                "Jane_SF_TOP_5.pdf": TOP_5_TEXT,
+                "Jane_ACTION_PLANNING_TOP_10.pdf": ACTION_PLANNING_TEXT,
+            },
+        )
+        names = [s.name for s in sections]
+        assert "Detailed Strength Insights" in names
+        assert "Personalized Talent Patterns" in names
+        assert "Strengths in Practice" in names
+
+    def test_top_10_report_fills_top_5(self, tmp_path):
+        sections = _gather(tmp_path, {"Jane_TOP_10.pdf": TOP_10_TEXT})
+        by_name = {s.name: s.content for s in sections}
+
+        assert "**Description:**" in by_name["Detailed Strength Insights"]
+        assert "| 6 | Focus | EXECUTING |" in by_name["Supporting Strengths (6-10)"]
+
+    def test_action_planning_items_win_over_report_bullets(self, tmp_path):
+        """Ranking reports are parsed first, so richer Action Planning items survive."""
+        sections = _gather(
+            tmp_path,
+            {
+                "Jane_ACTION_PLANNING_TOP_10.pdf": ACTION_PLANNING_TEXT,
+                "Jane_TOP_10.pdf": TOP_10_TEXT,
+            },
+        )
+        details = {s.name: s.content for s in sections}["Detailed Strength Insights"]
+
+        assert "**Description:** You love to learn" in details
+        assert "- Refine how you learn by teaching others" in details
+
+    def test_redundant_ranking_report_is_not_extracted(self, tmp_path):
+        texts = {"Jane_ALL_34.pdf": TOP_10_TEXT, "Jane_SF_TOP_5.pdf": TOP_5_TEXT}
+        for name in texts:
+            (tmp_path / name).write_bytes(b"%PDF-1.4 fake")
+        with patch.object(
+            CliftonStrengthsGatherer,
+            "_extract_text",
+            side_effect=lambda path: texts[path.name],
+        ) as extract:
+            sections = CliftonStrengthsGatherer().gather(tmp_path)
+
+        assert [call.args[0].name for call in extract.call_args_list] == ["Jane_ALL_34.pdf"]
+        assert "Detailed Strength Insights" in [s.name for s in sections]
+
+    def test_empty_extraction_yields_no_sections(self, tmp_path):
+        assert _gather(tmp_path, {"Jane_SF_TOP_5.pdf": ""}) == []
+
+
+def test_strength_insight_defaults():
+    insight = StrengthInsight(rank=1, name="Learner", domain="STRATEGIC THINKING")
+    assert insight.action_items == []
+    assert insight.unique_insights == []
+
+
+def test_dataclasses_use_slots():
+    insight = StrengthInsight(rank=1, name="Learner", domain="STRATEGIC THINKING")
+    with pytest.raises(AttributeError):
+        insight.score = 1  # type: ignore[attr-defined]
+    assert not hasattr(CliftonStrengthsData(), "__dict__")
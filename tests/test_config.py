@@ -1,6 +1,8 @@
 """Tests for configuration management."""
 
-from fu7ur3pr00f.config import Settings
+from functools import cached_property
+
+from fu7ur3pr00f.config import _DERIVED_FLAGS, Settings
 
 
 def make_settings(**overrides) -> Settings:
@@ -53,6 +55,22 @@ class TestSettings:
         assert s.processed_dir.parent == s.data_dir
         assert s.output_dir.parent == s.data_dir
 
+    def test_settings_are_frozen(self) -> None:
+        """Test direct assignment is rejected; reload_settings is the only writer."""
+        import pytest
+        from pydantic import ValidationError
+
+        s = make_settings()
+        with pytest.raises(ValidationError):
+            s.llm_provider = "openai"
+
+    def test_directory_paths_are_cached(self) -> None:
+        """Test path properties are computed once per instance."""
+        s = make_settings()
+        assert s.data_dir is s.data_dir
+        assert s.raw_dir is s.raw_dir
+        assert s.market_cache_dir is s.market_cache_dir
+
     def test_ensure_directories_creates_dirs(self, tmp_path) -> None:
         """Test ensure_directories creates required directories."""
         data_dir = tmp_path / "data"
@@ -71,6 +89,18 @@ class TestSettings:
         assert processed_dir.exists()
         assert output_dir.exists()
 
+    def test_ensure_directories_uses_data_dir(self, tmp_path, monkeypatch) -> None:
+        """Test ensure_directories creates each leaf with 0o700 permissions."""
+        import stat
+
+        monkeypatch.setattr("fu7ur3pr00f.config._USER_DIR", tmp_path)
+        s = make_settings()
+        s.ensure_directories()
+
+        for dir_path in [s.raw_dir, s.processed_dir, s.output_dir]:
+            assert dir_path.parent == tmp_path / "data"
+            assert stat.S_IMODE(dir_path.stat().st_mode) == 0o700
+
     def test_portfolio_url_default(self) -> None:
         """Test portfolio_url has a default value."""
         s = make_settings()
@@ -137,6 +167,29 @@ class TestProviderDetection:
         assert s.has_proxy is False
         assert s.has_azure is False
 
+    def test_is_provider_configured(self) -> None:
+        """Test provider lookup maps IDs onto has_* flags."""
+        s = make_settings(anthropic_api_key="sk-ant-test")
+        assert s.is_provider_configured("anthropic") is True
+        assert s.is_provider_configured("openai") is False
+        assert s.is_provider_configured("unknown") is False
+
+    def test_derived_flags_cover_non_path_cached_properties(self) -> None:
+        """Every memoized flag is cleared on reload; memoized paths are kept."""
+        cached = {
+            name for name, attr in vars(Settings).items() if isinstance(attr, cached_property)
+        }
+        paths = {"data_dir", "market_cache_dir", "raw_dir", "processed_dir", "output_dir"}
+        assert set(_DERIVED_FLAGS) == cached - paths
+
+    def test_clear_derived_flags_recomputes(self) -> None:
+        """Flags follow field values once the memoized results are dropped."""
+        s = make_settings()
+        assert s.has_anthropic is False
+        object.__setattr__(s, "anthropic_api_key", "sk-ant-test")
+        s._clear_derived_flags()
+        assert s.has_anthropic is True
+
 
 class TestAzureEndpointNormalization:
     """Test Azure endpoint URL cleaning."""
@@ -204,3 +257,46 @@ class TestWriteUserSettingCleaning:
         content = env_file.read_text()
         assert "/api/projects/" not in content
         assert "https://res.services.ai.azure.com" in content
+
+
+class TestLazySettings:
+    """Test the lazily built module-level settings singleton."""
+
+    def test_get_settings_is_cached(self) -> None:
+        from fu7ur3pr00f.config import get_settings
+
+        assert get_settings() is get_settings()
+
+    def test_module_attribute_returns_singleton(self) -> None:
+        import fu7ur3pr00f.config as config
+
+        assert config.settings is config.get_settings()
+
+    def test_unknown_attribute_raises(self) -> None:
+        import pytest
+
+        import fu7ur3pr00f.config as config
+
+        with pytest.raises(AttributeError):
+            _ = config.not_a_setting  # type: ignore[attr-defined]
+
+
+class TestExistingEnvFiles:
+    """Test env-file discovery used when building the settings singleton."""
+
+    def test_skips_missing_files(self, tmp_path, monkeypatch) -> None:
+        from fu7ur3pr00f.config import _existing_env_files
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("fu7ur3pr00f.config._USER_ENV_PATH", tmp_path / "missing.env")
+        assert _existing_env_files() == ()
+
+    def test_keeps_load_order(self, tmp_path, monkeypatch) -> None:
+        from fu7ur3pr00f.config import _existing_env_files
+
+        user_env = tmp_path / "user.env"
+        user_env.write_text("")
+        (tmp_path / ".env").write_text("")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("fu7ur3pr00f.config._USER_ENV_PATH", user_env)
+        assert _existing_env_files() == (str(tmp_path / ".env"), str(user_env))
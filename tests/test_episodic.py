@@ -0,0 +1,43 @@
+"""Tests for the episodic memory store."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from fu7ur3pr00f.memory.episodic import (
+    EpisodicStore,
+    remember_application,
+    remember_decision,
+)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> EpisodicStore:
+    """Episodic store with a mocked ChromaDB collection."""
+    store = EpisodicStore(persist_dir=tmp_path)
+    store._collection = MagicMock()
+    return store
+
+
+class TestRememberMany:
+    """Test batched inserts."""
+
+    def test_single_add_for_all_memories(self, store: EpisodicStore) -> None:
+        memories = [
+            remember_decision("Declined the offer", "Salary below market"),
+            remember_application("Acme", "Backend Engineer", "applied"),
+        ]
+
+        ids = store.remember_many(memories)
+
+        assert ids == [m.id for m in memories]
+        store.collection.add.assert_called_once_with(
+            ids=ids,
+            documents=[m.content for m in memories],
+            metadatas=[m.to_metadata() for m in memories],
+        )
+
+    def test_empty_list_skips_chromadb(self, store: EpisodicStore) -> None:
+        assert store.remember_many([]) == []
+        store.collection.add.assert_not_called()
@@ -0,0 +1,43 @@
+"""Tests for GitLab tool input validation."""
+
+import pytest
+
+from fu7ur3pr00f.agents.tools.gitlab import (
+    _FILE_PATH_CHARS,
+    _GIT_REF_CHARS,
+    _PROJECT_PATH_CHARS,
+    _validate_gitlab_input,
+)
+
+
+class TestValidateGitlabInput:
+    """Test character-set validation of glab arguments."""
+
+    @pytest.mark.parametrize(
+        ("value", "allowed"),
+        [
+            ("group/sub-group/project.name", _PROJECT_PATH_CHARS),
+            ("release/v1.2_rc", _GIT_REF_CHARS),
+            ("docs/User Guide.md", _FILE_PATH_CHARS),
+        ],
+    )
+    def test_valid_input(self, value: str, allowed: frozenset[str]) -> None:
+        assert _validate_gitlab_input(value, "value", allowed, 256) is None
+
+    @pytest.mark.parametrize("value", ["group/project;rm", "a b", "proj$(id)"])
+    def test_disallowed_character(self, value: str) -> None:
+        error = _validate_gitlab_input(value, "project path", _PROJECT_PATH_CHARS, 256)
+        assert error == "Invalid project path: contains disallowed characters."
+
+    def test_trailing_newline_rejected(self) -> None:
+        """A trailing newline is rejected (a '^...$' regex let it through)."""
+        error = _validate_gitlab_input("main\n", "ref", _GIT_REF_CHARS, 256)
+        assert error == "Invalid ref: contains disallowed characters."
+
+    def test_leading_dash_rejected(self) -> None:
+        error = _validate_gitlab_input("--help", "ref", _GIT_REF_CHARS, 256)
+        assert error == "Invalid ref: must not start with '-'."
+
+    def test_length_limits(self) -> None:
+        assert _validate_gitlab_input("", "ref", _GIT_REF_CHARS, 8) is not None
+        assert _validate_gitlab_input("a" * 9, "ref", _GIT_REF_CHARS, 8) is not None
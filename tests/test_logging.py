@@ -0,0 +1,53 @@
+"""Tests for logging configuration."""
+
+import logging
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+import pytest
+
+from fu7ur3pr00f.utils import logging as log_utils
+
+
+@pytest.fixture(autouse=True)
+def _reset_logging():
+    """Stop the file listener and drop handlers added by a test."""
+    logger = logging.getLogger("fu7ur3pr00f")
+    handlers, level = list(logger.handlers), logger.level
+    yield
+    log_utils._stop_file_listener()
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+class TestFileLogging:
+    """Test queued file logging."""
+
+    def test_reconfigure_replaces_listener(self, tmp_path: Path) -> None:
+        first_file = tmp_path / "first.log"
+        second_file = tmp_path / "second.log"
+
+        log_utils.setup_logging(log_file=first_file)
+        first_listener = log_utils._file_listener
+        logger = log_utils.setup_logging(log_file=second_file)
+
+        assert first_listener is not None
+        assert first_listener._thread is None  # stopped
+        assert log_utils._file_listener is not first_listener
+        assert sum(isinstance(h, QueueHandler) for h in logger.handlers) == 1
+
+        log_utils.get_logger("test").info("after reconfigure")
+        log_utils._stop_file_listener()
+
+        assert "after reconfigure" in second_file.read_text()
+        assert "after reconfigure" not in first_file.read_text()
+
+    def test_stop_flushes_queued_records(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "app.log"
+        log_utils.setup_logging(level="DEBUG", log_file=log_file)
+
+        log_utils.get_logger("test").debug("queued record")
+        log_utils._stop_file_listener()
+
+        assert log_utils._file_listener is None
+        assert "queued record" in log_file.read_text()
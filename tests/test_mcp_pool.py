@@ -0,0 +1,32 @@
+"""Tests for the MCP pool's background event loop."""
+
+import asyncio
+
+import pytest
+
+from fu7ur3pr00f.mcp import pool
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return 42
+
+
+class TestRunCoroutine:
+    """Test running coroutines on the pool loop from sync code."""
+
+    def test_returns_result(self) -> None:
+        assert pool.run_coroutine(_answer()) == 42
+
+    def test_reuses_loop(self) -> None:
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        assert pool.run_coroutine(current_loop()) is pool.run_coroutine(current_loop())
+
+    def test_call_from_loop_thread_raises(self) -> None:
+        async def reenter() -> None:
+            pool.run_coroutine(_answer())
+
+        with pytest.raises(RuntimeError, match="own thread"):
+            pool.run_coroutine(reenter(), timeout=5)
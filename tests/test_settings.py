@@ -118,6 +118,23 @@ class TestReloadSettings:
             reload_settings()
             assert id(settings) == obj_id
 
+    def test_refreshes_memoized_flags(self) -> None:
+        """Cached has_* flags follow the reloaded field values."""
+        from fu7ur3pr00f.config import get_settings, reload_settings
+
+        fresh = _make_settings(tavily_api_key="tvly-new")
+        current = get_settings()
+        snapshot = current.model_copy()
+        assert current.has_tavily_mcp is bool(current.tavily_api_key)
+
+        with patch("fu7ur3pr00f.config._load_settings", return_value=fresh):
+            reload_settings()
+        try:
+            assert current.has_tavily_mcp is True
+        finally:
+            with patch("fu7ur3pr00f.config._load_settings", return_value=snapshot):
+                reload_settings()
+
 
 # ── get_user_env_path ───────────────────────────────────────────────────
 